@@ -5,14 +5,17 @@
 
 __version__ = "0.1.0"
 
-from ai_usage_measurement_framework.models import (
-    Detection,
-    RepoAnalysis,
-    AuthorStats,
-    ToolStats,
-    Signal,
-    ConfidenceLevel,
-)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ai_usage_measurement_framework.models import (
+        Detection,
+        RepoAnalysis,
+        AuthorStats,
+        ToolStats,
+        Signal,
+        ConfidenceLevel,
+    )
 
 __all__ = [
     "__version__",
@@ -23,3 +26,12 @@ __all__ = [
     "Signal",
     "ConfidenceLevel",
 ]
+
+
+def __getattr__(name: str):
+    # Building the pydantic models is most of the package's import time, so
+    # the CLI can print --version and --help without it
+    if name in __all__ and name != "__version__":
+        from ai_usage_measurement_framework import models
+        return getattr(models, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,7 +3,21 @@
 
 """Analyzers for detecting AI usage in repositories."""
 
-from ai_usage_measurement_framework.analyzers.git_analyzer import GitAnalyzer
-from ai_usage_measurement_framework.analyzers.github_analyzer import GitHubAnalyzer
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ai_usage_measurement_framework.analyzers.git_analyzer import GitAnalyzer
+    from ai_usage_measurement_framework.analyzers.github_analyzer import GitHubAnalyzer
 
 __all__ = ["GitAnalyzer", "GitHubAnalyzer"]
+
+
+def __getattr__(name: str):
+    # Analyzers pull in GitPython and requests, so load them on first use
+    if name == "GitAnalyzer":
+        from ai_usage_measurement_framework.analyzers.git_analyzer import GitAnalyzer
+        return GitAnalyzer
+    if name == "GitHubAnalyzer":
+        from ai_usage_measurement_framework.analyzers.github_analyzer import GitHubAnalyzer
+        return GitHubAnalyzer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
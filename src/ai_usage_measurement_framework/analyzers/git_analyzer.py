@@ -3,36 +3,217 @@
 
 """Git repository analyzer for AI usage detection."""
 
+import hashlib
 import os
 import re
 import shutil
+import subprocess
 import tempfile
+import time
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import repeat
 from pathlib import Path
-from typing import Optional
+from typing import IO, Iterator, Optional, cast
 from urllib.parse import urlparse
 
 from git import Repo
 from git.exc import GitCommandError, InvalidGitRepositoryError
+from pydantic import TypeAdapter
 
+from ai_usage_measurement_framework import __version__
 from ai_usage_measurement_framework.models import (
     AgentsFileInfo,
     AuthorStats,
-    ConfidenceLevel,
     Detection,
     RepoAnalysis,
-    Signal,
     TimelineEntry,
     ToolStats,
 )
 from ai_usage_measurement_framework.patterns import (
     AI_COMMIT_PATTERNS,
+    GENERIC_AI_PATTERNS,
     TOOL_PATTERNS,
     calculate_confidence_score,
-    detect_ai_patterns,
+    compile_patterns,
+    detect_ai_usage,
     extract_ai_tools,
 )
+from ai_usage_measurement_framework.utils.cache import get_cache_dir, read_entry, write_entry
+
+# Commits handed to each worker process per round-trip
+_CHUNKSIZE = 64
+
+# Directories that are never searched for Agents.md files
+_SKIP_DIRS = frozenset((".git", "node_modules", ".venv", "venv", "__pycache__"))
+
+# File names (lowercased) recognised as Agents.md files
+_AGENTS_FILENAMES = frozenset(("agents.md", ".agents.md", "agent.md"))
+
+# Field/record separators and format for reading commit metadata; the
+# numstat lines for each commit follow its final field separator
+_FIELD_SEP = "\x1f"
+_RECORD_SEP = "\x1e"
+_LOG_FORMAT = "%x1e%H%x1f%an%x1f%ae%x1f%ct%x1f%B%x1f"
+
+# Validates the collected detection rows in one pass
+_DETECTION_LIST = TypeAdapter(list[Detection])
+
+
+def _sum_numstat(block: str) -> tuple[int, int, int]:
+    """Total up a commit's `git log --numstat` lines.
+
+    Args:
+        block: The commit's numstat lines
+
+    Returns:
+        Tuple of (lines_added, lines_deleted, files_changed)
+    """
+    added = deleted = files = 0
+    for line in block.splitlines():
+        if line:
+            # "<added>\t<deleted>\t<path>", with "-" for binary files
+            ins, dels, _ = line.split("\t", 2)
+            added += int(ins) if ins != "-" else 0
+            deleted += int(dels) if dels != "-" else 0
+            files += 1
+    return added, deleted, files
+
+
+def _is_agents_path(path: str) -> bool:
+    """Check whether a repository-relative path is an Agents.md file to parse."""
+    *dirs, name = path.split("/")
+    return name.lower() in _AGENTS_FILENAMES and not _SKIP_DIRS.intersection(dirs)
+
+
+def _parse_agents_file(path: str, data: bytes) -> Optional[AgentsFileInfo]:
+    """Build an AgentsFileInfo from raw blob contents.
+
+    Returns:
+        AgentsFileInfo, or None if the file isn't valid UTF-8
+    """
+    try:
+        content = data.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+    # Normalise newlines the way reading in text mode does
+    content = content.replace("\r\n", "\n").replace("\r", "\n")
+
+    return AgentsFileInfo(
+        path=path,
+        content=content[:5000],  # Limit content size
+        tools_mentioned=extract_ai_tools(content),
+    )
+
+
+def _iter_agents_blobs(raw: str) -> Iterator[tuple[str, str]]:
+    """Yield (path, blob_sha) for Agents.md files in `git ls-tree -r -z` output.
+
+    Paths inside skipped directories (e.g. a committed node_modules) are
+    ignored, as are symlinks and submodules.
+    """
+    for entry in raw.split("\x00"):
+        if not entry:
+            continue
+        info, path = entry.split("\t", 1)
+        mode, obj_type, sha = info.split()
+        if obj_type != "blob" or mode == "120000":
+            continue
+        if _is_agents_path(path):
+            yield path, sha
+
+
+def _fetch_mirror(url: str, auth_url: str, mirror_root: Path) -> Path:
+    """Create or refresh a bare mirror of url under mirror_root.
+
+    Only new objects are transferred on repeat runs. The token is passed
+    on each fetch rather than stored in the mirror's config.
+
+    Args:
+        url: Repository URL, used to name the mirror
+        auth_url: URL to fetch from, possibly carrying a token
+        mirror_root: Directory holding all mirrors
+
+    Returns:
+        Path to the mirror
+    """
+    parsed = urlparse(url if "://" in url else f"ssh://{url.replace(':', '/', 1)}")
+    slug = f"{parsed.hostname or 'local'}/{parsed.path.strip('/')}"
+    if not slug.endswith(".git"):
+        slug += ".git"
+    mirror_dir = mirror_root / slug
+
+    try:
+        if (mirror_dir / "HEAD").exists():
+            Repo(mirror_dir).git.fetch(auth_url, "+refs/*:refs/*", "--prune")
+        else:
+            Repo.clone_from(auth_url, mirror_dir, mirror=True).close()
+            Repo(mirror_dir).git.remote("set-url", "origin", url)
+        return mirror_dir
+    except GitCommandError as e:
+        raise ValueError(f"Failed to update repository mirror: {e}")
+
+
+def _init_worker(
+    ai_patterns: list[str],
+    tool_patterns: dict,
+    generic_patterns: dict,
+) -> None:
+    """Give a worker process the parent's pattern tables.
+
+    Workers started with spawn (the default on macOS and Windows) import
+    the patterns module afresh, which would drop patterns added or edited
+    at runtime.
+    """
+    AI_COMMIT_PATTERNS[:] = ai_patterns
+    TOOL_PATTERNS.clear()
+    TOOL_PATTERNS.update(tool_patterns)
+    GENERIC_AI_PATTERNS.clear()
+    GENERIC_AI_PATTERNS.update(generic_patterns)
+    compile_patterns()
+
+
+def _analyze_commit(
+    message: str,
+    stats: tuple[int, int, int],
+    has_agents_file: bool,
+) -> Optional[dict]:
+    """Scan a single commit for AI usage.
+
+    Runs in a worker process, so it only takes and returns pickleable values.
+
+    Args:
+        message: Commit message
+        stats: (lines_added, lines_deleted, files_changed) for the commit
+        has_agents_file: Whether the repo has an Agents.md file
+
+    Returns:
+        Dict with the detection details, or None if no AI usage was found
+    """
+    patterns_matched, tools_detected = detect_ai_usage(message)
+    if not (patterns_matched or tools_detected):
+        return None
+
+    lines_added, lines_deleted, files_changed = stats
+
+    confidence_score, confidence_level = calculate_confidence_score(
+        patterns_matched,
+        tools_detected,
+        has_agents_file,
+        lines_added,
+        lines_deleted,
+    )
+
+    return {
+        "patterns_matched": patterns_matched,
+        "tools_detected": tools_detected,
+        "confidence_score": confidence_score,
+        "confidence_level": confidence_level,
+        "lines_added": lines_added,
+        "lines_deleted": lines_deleted,
+        "files_changed": files_changed,
+    }
 
 
 class GitAnalyzer:
@@ -45,6 +226,7 @@ class GitAnalyzer:
         since_date: Optional[datetime] = None,
         until_date: Optional[datetime] = None,
         github_token: Optional[str] = None,
+        num_processes: int = 1,
     ):
         """Initialize the analyzer.
         
@@ -54,37 +236,129 @@ class GitAnalyzer:
             since_date: Only analyze commits after this date
             until_date: Only analyze commits before this date
             github_token: GitHub token for private repositories
+            num_processes: Worker processes for commit analysis (default: 1, serial)
         """
         self.repo_path = repo_path
         self.branch = branch
         self.since_date = since_date
         self.until_date = until_date
         self.github_token = github_token
+        self.num_processes = max(1, num_processes or 1)
         self._temp_dir: Optional[str] = None
         self._repo: Optional[Repo] = None
+        # Long-running `git cat-file --batch` process
+        self._cat_file: Optional[subprocess.Popen[bytes]] = None
 
     def _is_remote_url(self, path: str) -> bool:
         """Check if the path is a remote URL."""
         return path.startswith(("http://", "https://", "git@", "ssh://"))
 
-    def _clone_repo(self, url: str) -> str:
-        """Clone a remote repository to a temporary directory."""
-        self._temp_dir = tempfile.mkdtemp(prefix="ai-usage-tracker-")
-        
-        # Add token to URL for private repos
+    def _authenticated_url(self, url: str) -> str:
+        """Add the GitHub token to an HTTP(S) URL for private repos."""
         if self.github_token and "github.com" in url:
             parsed = urlparse(url)
             if parsed.scheme in ("http", "https"):
                 url = f"{parsed.scheme}://{self.github_token}@{parsed.netloc}{parsed.path}"
+        return url
+
+    def _clone_repo(self, url: str) -> str:
+        """Clone a remote repository to a temporary directory.
+
+        Clones are bare: everything is read from the object database, so
+        writing out a working tree would be wasted I/O.
+
+        When a cache directory is configured, a persistent mirror is updated
+        instead and no temporary clone is made.
+        """
+        mirror_root = get_cache_dir("mirrors")
+        if mirror_root is not None:
+            return self._update_mirror(url, mirror_root)
+        
+        temp_dir = tempfile.mkdtemp(prefix="ai-usage-tracker-")
+        self._temp_dir = temp_dir
+        url = self._authenticated_url(url)
         
         try:
-            Repo.clone_from(url, self._temp_dir, depth=None)
-            return self._temp_dir
+            if self.since_date:
+                try:
+                    self._shallow_clone(url, temp_dir, self.since_date)
+                    return temp_dir
+                except GitCommandError:
+                    # e.g. no commits in the window; fall back to a full clone
+                    shutil.rmtree(temp_dir)
+                    os.makedirs(temp_dir)
+            Repo.clone_from(url, temp_dir, depth=None, bare=True)
+            return temp_dir
         except GitCommandError as e:
-            if self._temp_dir and os.path.exists(self._temp_dir):
-                shutil.rmtree(self._temp_dir)
+            if os.path.exists(temp_dir):
+                shutil.rmtree(temp_dir)
             raise ValueError(f"Failed to clone repository: {e}")
 
+    def _shallow_clone(self, url: str, dest: str, since_date: datetime) -> None:
+        """Clone only the history needed for the since_date window.
+
+        The clone is deepened by one commit so the oldest commits in the
+        window still have their parents, keeping line stats exact.
+        """
+        repo = Repo.clone_from(
+            url,
+            dest,
+            shallow_since=since_date.strftime("%Y-%m-%d"),
+            no_single_branch=True,
+            bare=True,
+        )
+        # Bare clones have no fetch refspec, so name the branches explicitly
+        repo.git.fetch("--deepen=1", "origin", "+refs/heads/*:refs/heads/*")
+        repo.close()
+
+    def _update_mirror(self, url: str, mirror_root: Path) -> str:
+        """Create or refresh a bare mirror of url under mirror_root."""
+        return str(_fetch_mirror(url, self._authenticated_url(url), mirror_root))
+
+    def _resolve_branch(self, repo: Repo) -> tuple[str, str]:
+        """Work out which revision to analyze without checking it out.
+
+        Returns:
+            Tuple of (revision, branch_name)
+        """
+        if self.branch:
+            for rev in (self.branch, f"origin/{self.branch}"):
+                try:
+                    repo.git.rev_parse("--verify", "--quiet", f"{rev}^{{commit}}")
+                    return rev, self.branch
+                except GitCommandError:
+                    continue  # Branch might not exist, use current
+        
+        branch = repo.active_branch.name if not repo.head.is_detached else "HEAD"
+        return "HEAD", branch
+
+    def _analysis_cache_path(self, repo: Repo, rev: str, branch: str) -> Optional[Path]:
+        """Locate the cached analysis for the current revision and options.
+
+        Returns:
+            Cache entry path, or None if caching is disabled or the revision
+            can't be resolved
+        """
+        cache_root = get_cache_dir("analyses")
+        if cache_root is None:
+            return None
+        try:
+            head_sha = repo.git.rev_parse(f"{rev}^{{commit}}")
+        except GitCommandError:
+            return None
+        
+        source = (
+            self.repo_path if self._is_remote_url(self.repo_path)
+            else os.path.abspath(self.repo_path)
+        )
+        key = "\0".join((
+            __version__, source, branch, head_sha,
+            str(self.since_date), str(self.until_date),
+        ))
+        # One directory per repository, so eviction is per repository
+        repo_dir = hashlib.sha256(source.encode()).hexdigest()[:16]
+        return cache_root / repo_dir / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
     def _open_repo(self) -> Repo:
         """Open the repository."""
         if self._repo is not None:
@@ -111,38 +385,114 @@ class GitAnalyzer:
         else:
             return Path(self.repo_path).name
 
-    def _find_agents_files(self, repo: Repo) -> list[AgentsFileInfo]:
-        """Find and parse Agents.md files in the repository."""
-        agents_files = []
-        repo_dir = repo.working_dir
+    def _find_agents_files(self, repo: Repo, rev: str = "HEAD") -> list[AgentsFileInfo]:
+        """Find and parse Agents.md files in the repository.
+
+        Files are listed and read from the object database at rev, so no
+        working tree checkout is needed.
+        """
+        agents_files: list[AgentsFileInfo] = []
+
+        try:
+            raw = repo.git.ls_tree("-r", "-z", "--full-tree", rev)
+        except GitCommandError:
+            return agents_files  # e.g. a repository without commits
 
-        for root, dirs, files in os.walk(repo_dir):
-            # Skip .git directory
-            if ".git" in root:
+        for rel_path, sha in _iter_agents_blobs(raw):
+            try:
+                _, data = self._read_object(repo, sha)
+            except ValueError:
                 continue
-            
-            for filename in files:
-                if filename.lower() in ("agents.md", ".agents.md", "agent.md"):
-                    filepath = os.path.join(root, filename)
-                    rel_path = os.path.relpath(filepath, repo_dir)
-                    
-                    try:
-                        with open(filepath, "r", encoding="utf-8") as f:
-                            content = f.read()
-                        
-                        # Extract tool mentions
-                        tools = extract_ai_tools(content)
-                        
-                        agents_files.append(AgentsFileInfo(
-                            path=rel_path,
-                            content=content[:5000],  # Limit content size
-                            tools_mentioned=tools,
-                        ))
-                    except (IOError, UnicodeDecodeError):
-                        continue
+
+            info = _parse_agents_file(rel_path, data)
+            if info is not None:
+                agents_files.append(info)
 
         return agents_files
 
+    def _read_object(self, repo: Repo, sha: str) -> tuple[str, bytes]:
+        """Read a raw object through the persistent cat-file process.
+
+        Returns:
+            Tuple of (object_type, raw_data)
+        """
+        proc = self._cat_file
+        if proc is None:
+            proc = self._cat_file = subprocess.Popen(
+                [repo.git.GIT_PYTHON_GIT_EXECUTABLE or "git", "--git-dir", repo.git_dir,
+                 "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+            )
+        # Both streams exist since the process was opened with pipes
+        stdin = cast(IO[bytes], proc.stdin)
+        stdout = cast(IO[bytes], proc.stdout)
+        stdin.write(f"{sha}\n".encode())
+        stdin.flush()
+
+        # Header: "<sha> <type> <size>", or "<sha> missing"
+        header = stdout.readline().split()
+        if len(header) != 3:
+            raise ValueError(f"Object not found: {sha}")
+        data = stdout.read(int(header[2]))
+        stdout.read(1)  # trailing newline
+        return header[1].decode(), data
+
+    def _read_history(
+        self, repo: Repo, rev: str, commit_kwargs: dict
+    ) -> tuple[list[tuple[str, str, str, int, str]], dict[str, tuple[int, int, int]]]:
+        """Read metadata and line stats for every commit with one git log call.
+
+        Merge commits are diffed against their first parent and renames are
+        not detected, matching GitPython's `Commit.stats`.
+
+        Returns:
+            Tuple of ((hexsha, author, email, committed_date, message) list,
+            mapping of hexsha to (lines_added, lines_deleted, files_changed))
+        """
+        raw = repo.git.log(
+            "--numstat",
+            "--no-renames",
+            "--diff-merges=first-parent",
+            f"--format={_LOG_FORMAT}",
+            rev,
+            no_color=True,
+            **commit_kwargs,
+        )
+        commits = []
+        stats_by_sha = {}
+        for record in raw.split(_RECORD_SEP)[1:]:
+            hexsha, author_name, author_email, committed_date, message, numstat = (
+                record.split(_FIELD_SEP, 5)
+            )
+            commits.append((hexsha, author_name, author_email, int(committed_date), message))
+            stats_by_sha[hexsha] = _sum_numstat(numstat)
+        return commits, stats_by_sha
+
+    def _map_commits(
+        self,
+        commits: list[tuple[str, str, str, int, str]],
+        stats_by_sha: dict[str, tuple[int, int, int]],
+        has_agents_file: bool,
+    ) -> Iterator[Optional[dict]]:
+        """Run `_analyze_commit` over all commits, in parallel when worthwhile."""
+        args = (
+            [c[4] for c in commits],
+            [stats_by_sha.get(c[0], (0, 0, 0)) for c in commits],
+            repeat(has_agents_file),
+        )
+
+        if self.num_processes <= 1 or len(commits) <= _CHUNKSIZE:
+            yield from map(_analyze_commit, *args)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=self.num_processes,
+            initializer=_init_worker,
+            initargs=(AI_COMMIT_PATTERNS, TOOL_PATTERNS, GENERIC_AI_PATTERNS),
+        ) as executor:
+            yield from executor.map(_analyze_commit, *args, chunksize=_CHUNKSIZE)
+
     def analyze(self) -> RepoAnalysis:
         """Analyze the repository for AI usage.
         
@@ -153,26 +503,17 @@ class GitAnalyzer:
         repo_name = self._get_repo_name()
         
         # Determine branch
-        if self.branch:
-            try:
-                repo.git.checkout(self.branch)
-            except GitCommandError:
-                pass  # Branch might not exist, use current
+        rev, current_branch = self._resolve_branch(repo)
         
-        current_branch = repo.active_branch.name if not repo.head.is_detached else "HEAD"
+        # Reuse a previous analysis of the same revision if one is cached
+        cache_path = self._analysis_cache_path(repo, rev, current_branch)
+        if cache_path is not None:
+            cached = read_entry(cache_path)
+            if cached is not None:
+                return RepoAnalysis.model_validate_json(cached)
         
         # Find Agents.md files
-        agents_files = self._find_agents_files(repo)
-        has_agents_file = len(agents_files) > 0
-        
-        # Analyze commits
-        detections: list[Detection] = []
-        commits_by_author: dict[str, int] = defaultdict(int)
-        ai_commits_by_author: dict[str, int] = defaultdict(int)
-        tools_by_author: dict[str, set] = defaultdict(set)
-        timeline: dict[str, dict] = defaultdict(lambda: {"total": 0, "ai": 0, "tools": defaultdict(int)})
-        all_tools: set[str] = set()
-        tool_commits: dict[str, list] = defaultdict(list)
+        agents_files = self._find_agents_files(repo, rev)
         
         # Build commit iterator with date filters
         commit_kwargs = {}
@@ -181,6 +522,52 @@ class GitAnalyzer:
         if self.until_date:
             commit_kwargs["before"] = self.until_date.strftime("%Y-%m-%d")
         
+        commits, stats_by_sha = self._read_history(repo, rev, commit_kwargs)
+        
+        analysis = self.build_analysis(
+            repo_name, current_branch, commits, stats_by_sha, agents_files
+        )
+        if cache_path is not None:
+            write_entry(cache_path, analysis.model_dump_json().encode())
+        return analysis
+
+    def build_analysis(
+        self,
+        repo_name: str,
+        branch: str,
+        commits: list[tuple[str, str, str, int, str]],
+        stats_by_sha: dict[str, tuple[int, int, int]],
+        agents_files: list[AgentsFileInfo],
+    ) -> RepoAnalysis:
+        """Scan and aggregate already-fetched commit data.
+        
+        Args:
+            repo_name: Repository name
+            branch: Analyzed branch
+            commits: (hexsha, author, email, committed_date, message) tuples,
+                newest first
+            stats_by_sha: (lines_added, lines_deleted, files_changed) by sha
+            agents_files: Agents.md files found in the repository
+            
+        Returns:
+            RepoAnalysis object with all analysis results
+        """
+        has_agents_file = len(agents_files) > 0
+        
+        # Analyze commits
+        detections: list[dict] = []
+        commits_by_author: dict[str, int] = defaultdict(int)
+        ai_commits_by_author: dict[str, int] = defaultdict(int)
+        tools_by_author: dict[str, set] = defaultdict(set)
+        timeline_total: dict[str, int] = defaultdict(int)
+        timeline_ai: dict[str, int] = defaultdict(int)
+        timeline_tools: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        all_tools: set[str] = set()
+        tool_count: dict[str, int] = defaultdict(int)
+        tool_first: dict[str, datetime] = {}
+        tool_last: dict[str, datetime] = {}
+        tool_authors: dict[str, set] = defaultdict(set)
+        
         total_commits = 0
         ai_commits = 0
         high_conf = 0
@@ -188,44 +575,34 @@ class GitAnalyzer:
         low_conf = 0
         total_confidence = 0.0
         
-        for commit in repo.iter_commits(**commit_kwargs):
+        results = self._map_commits(commits, stats_by_sha, has_agents_file)
+        
+        # Local bindings for names used on every iteration of the hot loop
+        localtime = time.localtime
+        add_detection = detections.append
+        
+        for (hexsha, author_name, author_email, committed_date, message), result in zip(
+            commits, results
+        ):
             total_commits += 1
-            author_name = commit.author.name
-            author_email = commit.author.email
-            commit_date = datetime.fromtimestamp(commit.committed_date)
-            month_key = commit_date.strftime("%Y-%m")
+            # Derive both the datetime and month bucket from one struct_time;
+            # strftime is comparatively slow on the hot path.
+            tm = localtime(committed_date)
+            commit_date = datetime(*tm[:6])
+            month_key = f"{tm.tm_year:04d}-{tm.tm_mon:02d}"
             
             commits_by_author[author_name] += 1
-            timeline[month_key]["total"] += 1
-            
-            # Check for AI patterns
-            message = commit.message
-            patterns_matched = detect_ai_patterns(message)
-            tools_detected = extract_ai_tools(message)
+            timeline_total[month_key] += 1
             
-            if patterns_matched or tools_detected:
+            if result is not None:
+                patterns_matched = result["patterns_matched"]
+                tools_detected = result["tools_detected"]
+                confidence_score = result["confidence_score"]
+                confidence_level = result["confidence_level"]
+                
                 ai_commits += 1
                 ai_commits_by_author[author_name] += 1
-                timeline[month_key]["ai"] += 1
-                
-                # Calculate confidence
-                try:
-                    stats = commit.stats.total
-                    lines_added = stats.get("insertions", 0)
-                    lines_deleted = stats.get("deletions", 0)
-                    files_changed = stats.get("files", 0)
-                except Exception:
-                    lines_added = 0
-                    lines_deleted = 0
-                    files_changed = 0
-                
-                confidence_score, confidence_level = calculate_confidence_score(
-                    patterns_matched,
-                    tools_detected,
-                    has_agents_file,
-                    lines_added,
-                    lines_deleted,
-                )
+                timeline_ai[month_key] += 1
                 
                 total_confidence += confidence_score
                 if confidence_level == "high":
@@ -236,48 +613,57 @@ class GitAnalyzer:
                     low_conf += 1
                 
                 # Track tools
-                for tool in tools_detected:
-                    all_tools.add(tool)
-                    tools_by_author[author_name].add(tool)
-                    timeline[month_key]["tools"][tool] += 1
-                    tool_commits[tool].append(commit_date)
+                if tools_detected:
+                    author_tools = tools_by_author[author_name]
+                    month_tools = timeline_tools[month_key]
+                    for tool in tools_detected:
+                        all_tools.add(tool)
+                        author_tools.add(tool)
+                        month_tools[tool] += 1
+                        tool_count[tool] += 1
+                        tool_authors[tool].add(author_name)
+                        if tool not in tool_first or commit_date < tool_first[tool]:
+                            tool_first[tool] = commit_date
+                        if tool not in tool_last or commit_date > tool_last[tool]:
+                            tool_last[tool] = commit_date
                 
-                # Create detection record
+                # Create detection record. Rows stay plain dicts and are
+                # validated in a single pass when RepoAnalysis is built, which
+                # is cheaper than constructing each model individually.
                 signals = [
-                    Signal(
-                        name="pattern_match",
-                        value=min(len(patterns_matched) * 0.3, 1.0),
-                        weight=1.0,
-                        reason=f"Matched patterns: {', '.join(patterns_matched[:3])}",
-                        source="commit_message",
-                    )
+                    {
+                        "name": "pattern_match",
+                        "value": min(len(patterns_matched) * 0.3, 1.0),
+                        "weight": 1.0,
+                        "reason": f"Matched patterns: {', '.join(patterns_matched[:3])}",
+                        "source": "commit_message",
+                    }
                 ]
                 
                 if tools_detected:
-                    signals.append(Signal(
-                        name="tool_detected",
-                        value=0.8,
-                        weight=1.0,
-                        reason=f"Tools detected: {', '.join(tools_detected)}",
-                        source="commit_message",
-                    ))
+                    signals.append({
+                        "name": "tool_detected",
+                        "value": 0.8,
+                        "weight": 1.0,
+                        "reason": f"Tools detected: {', '.join(tools_detected)}",
+                        "source": "commit_message",
+                    })
                 
-                detection = Detection(
-                    commit_hash=commit.hexsha,
-                    author=author_name,
-                    author_email=author_email,
-                    date=commit_date,
-                    message=message[:500],
-                    tools_detected=tools_detected,
-                    patterns_matched=patterns_matched,
-                    signals=signals,
-                    confidence_score=confidence_score,
-                    confidence_level=ConfidenceLevel(confidence_level),
-                    files_changed=files_changed,
-                    lines_added=lines_added,
-                    lines_deleted=lines_deleted,
-                )
-                detections.append(detection)
+                add_detection({
+                    "commit_hash": hexsha,
+                    "author": author_name,
+                    "author_email": author_email,
+                    "date": commit_date,
+                    "message": message[:500],
+                    "tools_detected": tools_detected,
+                    "patterns_matched": patterns_matched,
+                    "signals": signals,
+                    "confidence_score": confidence_score,
+                    "confidence_level": confidence_level,
+                    "files_changed": result["files_changed"],
+                    "lines_added": result["lines_added"],
+                    "lines_deleted": result["lines_deleted"],
+                })
         
         # Build author stats
         author_stats = []
@@ -295,25 +681,25 @@ class GitAnalyzer:
         # Build tool stats
         tool_stats = []
         for tool in all_tools:
-            commits = tool_commits[tool]
-            authors_using = sum(1 for a, tools in tools_by_author.items() if tool in tools)
             tool_stats.append(ToolStats(
                 name=tool,
-                commit_count=len(commits),
-                author_count=authors_using,
-                first_seen=min(commits) if commits else None,
-                last_seen=max(commits) if commits else None,
+                commit_count=tool_count[tool],
+                author_count=len(tool_authors[tool]),
+                first_seen=tool_first.get(tool),
+                last_seen=tool_last.get(tool),
             ))
         
         # Build timeline entries
         timeline_entries = []
-        for month, data in sorted(timeline.items()):
+        for month in sorted(timeline_total):
+            month_total = timeline_total[month]
+            month_ai = timeline_ai.get(month, 0)
             timeline_entries.append(TimelineEntry(
                 date=month,
-                total_commits=data["total"],
-                ai_commits=data["ai"],
-                ai_percentage=round(data["ai"] / data["total"] * 100, 2) if data["total"] > 0 else 0,
-                tools=dict(data["tools"]),
+                total_commits=month_total,
+                ai_commits=month_ai,
+                ai_percentage=round(month_ai / month_total * 100, 2) if month_total > 0 else 0,
+                tools=dict(timeline_tools.get(month, {})),
             ))
         
         # Calculate averages
@@ -323,7 +709,7 @@ class GitAnalyzer:
         return RepoAnalysis(
             repo_name=repo_name,
             repo_path=self.repo_path,
-            branch=current_branch,
+            branch=branch,
             analyzed_at=datetime.now(),
             since_date=self.since_date,
             until_date=self.until_date,
@@ -333,7 +719,7 @@ class GitAnalyzer:
             total_authors=len(commits_by_author),
             ai_authors=len(ai_commits_by_author),
             tools_detected=list(all_tools),
-            detections=detections,
+            detections=_DETECTION_LIST.validate_python(detections),
             agents_files=agents_files,
             author_stats=author_stats,
             tool_stats=tool_stats,
@@ -345,12 +731,15 @@ class GitAnalyzer:
         )
 
     def cleanup(self):
-        """Clean up temporary files."""
+        """Clean up temporary files and helper processes."""
+        if self._cat_file is not None:
+            self._cat_file.communicate()  # closes stdin and waits for exit
+            self._cat_file = None
         if self._temp_dir and os.path.exists(self._temp_dir):
             shutil.rmtree(self._temp_dir)
             self._temp_dir = None
 
-    def __enter__(self):
+    def __enter__(self) -> "GitAnalyzer":
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
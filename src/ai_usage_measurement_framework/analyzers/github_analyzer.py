@@ -3,13 +3,143 @@
 
 """GitHub API analyzer for team and organization analysis."""
 
+import base64
+import hashlib
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Optional
+from pathlib import Path
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from ai_usage_measurement_framework.analyzers.git_analyzer import GitAnalyzer
-from ai_usage_measurement_framework.models import MultiRepoAnalysis, RepoAnalysis
+from ai_usage_measurement_framework.analyzers.git_analyzer import (
+    GitAnalyzer,
+    _is_agents_path,
+    _parse_agents_file,
+)
+from ai_usage_measurement_framework.models import (
+    AgentsFileInfo,
+    MultiRepoAnalysis,
+    RepoAnalysis,
+)
+from ai_usage_measurement_framework.utils.cache import get_cache_dir, read_entry, write_entry
+
+
+def _analyze_one(
+    repo: dict,
+    branch: Optional[str],
+    since_date: Optional[datetime],
+    until_date: Optional[datetime],
+    token: str,
+) -> RepoAnalysis:
+    """Clone and analyze a single repository."""
+    with GitAnalyzer(
+        repo_path=repo["clone_url"],
+        branch=branch or repo.get("default_branch"),
+        since_date=since_date,
+        until_date=until_date,
+        github_token=token,
+    ) as analyzer:
+        return analyzer.analyze()
+
+
+# Commit history of one branch, 100 commits per page
+_HISTORY_QUERY = """
+query($owner: String!, $name: String!, $ref: String!, $cursor: String,
+      $since: GitTimestamp, $until: GitTimestamp) {
+  repository(owner: $owner, name: $name) {
+    ref(qualifiedName: $ref) {
+      target {
+        ... on Commit {
+          history(first: 100, after: $cursor, since: $since, until: $until) {
+            nodes {
+              oid
+              message
+              committedDate
+              author { name email }
+              additions
+              deletions
+              changedFilesIfAvailable
+            }
+            pageInfo { endCursor hasNextPage }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Repositories of one team, 100 per page
+_TEAM_REPOS_QUERY = """
+query($org: String!, $slug: String!, $cursor: String) {
+  organization(login: $org) {
+    team(slug: $slug) {
+      repositories(first: 100, after: $cursor) {
+        nodes {
+          name
+          nameWithOwner
+          url
+          isPrivate
+          defaultBranchRef { name }
+        }
+        pageInfo { endCursor hasNextPage }
+      }
+    }
+  }
+}
+"""
+
+# Concurrent requests when fetching the remaining pages of a listing
+_PAGE_WORKERS = 8
+
+# Responses kept in the on-disk ETag cache per token
+_HTTP_CACHE_ENTRIES = 1000
+
+# Longest we'll sleep waiting for a rate limit to reset before giving up
+_MAX_RATE_LIMIT_WAIT = 300
+
+
+def _build_session(headers: dict) -> requests.Session:
+    """Create a keep-alive session that retries transient server errors."""
+    session = requests.Session()
+    session.headers.update(headers)
+    retry = Retry(
+        total=5,
+        backoff_factor=1,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=("GET", "POST"),
+        raise_on_status=False,
+    )
+    session.mount("https://", HTTPAdapter(max_retries=retry))
+    return session
+
+
+def _rate_limit_wait(resp: requests.Response) -> Optional[float]:
+    """Return seconds to wait if resp is a (secondary) rate limit response."""
+    if resp.status_code not in (403, 429):
+        return None
+    retry_after = resp.headers.get("Retry-After")
+    if retry_after is not None:
+        return float(retry_after)
+    if resp.headers.get("X-RateLimit-Remaining") == "0":
+        reset = int(resp.headers.get("X-RateLimit-Reset", "0"))
+        return max(reset - time.time(), 0) + 1
+    return None
+
+
+def _link_page(links: dict, rel: str) -> Optional[int]:
+    """Extract the page number of a Link header relation, if present."""
+    url = links.get(rel, {}).get("url")
+    if not url:
+        return None
+    page = parse_qs(urlparse(url).query).get("page")
+    return int(page[0]) if page else None
 
 
 class GitHubAnalyzer:
@@ -17,26 +147,84 @@ class GitHubAnalyzer:
 
     API_BASE = "https://api.github.com"
 
-    def __init__(self, token: str, org: Optional[str] = None):
+    def __init__(
+        self,
+        token: str,
+        org: Optional[str] = None,
+        max_workers: int = 8,
+        use_graphql: bool = True,
+    ):
         """Initialize the GitHub analyzer.
         
         Args:
             token: GitHub personal access token
             org: GitHub organization name
+            max_workers: Maximum number of repositories analyzed concurrently
+            use_graphql: List team repositories and fetch commit history
+                through the GraphQL API instead of REST pages and clones when
+                possible
         """
         self.token = token
         self.org = org
+        self.max_workers = max_workers
+        self.use_graphql = use_graphql
         self._headers = {
             "Authorization": f"Bearer {token}",
             "Accept": "application/vnd.github+json",
             "X-GitHub-Api-Version": "2022-11-28",
         }
+        self._session = _build_session(self._headers)
+        # URL + params -> (ETag, body, links) for conditional requests
+        self._etag_cache: dict[tuple, tuple[str, Any, dict]] = {}
+        # Persists the ETag cache across runs, separately for each token
+        self._http_cache_dir = get_cache_dir(
+            "github", hashlib.sha256(token.encode()).hexdigest()[:16]
+        )
 
-    def _request(self, endpoint: str, params: Optional[dict] = None) -> dict | list:
-        """Make a request to the GitHub API."""
-        url = f"{self.API_BASE}{endpoint}"
-        resp = requests.get(url, headers=self._headers, params=params or {})
+    def _http_cache_path(self, cache_key: tuple) -> Optional[Path]:
+        """Return the on-disk ETag cache entry for a request, if enabled."""
+        if self._http_cache_dir is None:
+            return None
+        digest = hashlib.sha256(repr(cache_key).encode()).hexdigest()
+        return self._http_cache_dir / f"{digest}.json"
+
+    def _request(self, endpoint: str, params: Optional[dict] = None) -> dict[str, Any]:
+        """Make a request to a GitHub API endpoint that returns one object.
+
+        List endpoints go through `_paginate` instead.
+        """
+        data = self._request_with_links(endpoint, params)[0]
+        if not isinstance(data, dict):
+            raise ValueError(f"Unexpected GitHub API response for {endpoint}")
+        return data
+
+    def _request_with_links(
+        self, endpoint: str, params: Optional[dict] = None
+    ) -> tuple[Any, dict]:
+        """Make a request to the GitHub API.
         
+        Returns:
+            Tuple of (response data, parsed Link header relations)
+        """
+        url = f"{self.API_BASE}{endpoint}"
+        params = params or {}
+        cache_key = (url, tuple(sorted(params.items())))
+        cached = self._etag_cache.get(cache_key)
+        cache_path = self._http_cache_path(cache_key)
+        if cached is None and cache_path is not None:
+            entry = read_entry(cache_path)
+            if entry is not None:
+                cached = tuple(json.loads(entry))
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        resp = self._session.get(url, params=params, headers=headers)
+        wait = _rate_limit_wait(resp)
+        if wait is not None and wait <= _MAX_RATE_LIMIT_WAIT:
+            time.sleep(wait)
+            resp = self._session.get(url, params=params, headers=headers)
+
+        if resp.status_code == 304 and cached:
+            return cached[1], cached[2]
         if resp.status_code == 401:
             raise ValueError("Invalid GitHub token. Please check your token and try again.")
         if resp.status_code == 403:
@@ -46,27 +234,206 @@ class GitHubAnalyzer:
         if resp.status_code != 200:
             raise ValueError(f"GitHub API error: {resp.status_code} - {resp.text}")
         
-        return resp.json()
+        data = resp.json()
+        etag = resp.headers.get("ETag")
+        if etag:
+            self._etag_cache[cache_key] = (etag, data, resp.links)
+            if cache_path is not None:
+                write_entry(
+                    cache_path,
+                    json.dumps([etag, data, resp.links]).encode(),
+                    keep=_HTTP_CACHE_ENTRIES,
+                )
+        return data, resp.links
+
+    def _graphql(self, query: str, variables: dict) -> dict[str, Any]:
+        """Run a GraphQL query and return its data."""
+        resp = self._session.post(
+            f"{self.API_BASE}/graphql",
+            json={"query": query, "variables": variables},
+        )
+        wait = _rate_limit_wait(resp)
+        if wait is not None and wait <= _MAX_RATE_LIMIT_WAIT:
+            time.sleep(wait)
+            resp = self._session.post(
+                f"{self.API_BASE}/graphql",
+                json={"query": query, "variables": variables},
+            )
+        
+        if resp.status_code != 200:
+            raise ValueError(f"GitHub GraphQL error: {resp.status_code} - {resp.text}")
+        body = resp.json()
+        if body.get("errors"):
+            raise ValueError(f"GitHub GraphQL error: {body['errors'][0].get('message')}")
+        data = body.get("data")
+        if not isinstance(data, dict):
+            raise ValueError("GitHub GraphQL response has no data")
+        return data
 
     def _paginate(self, endpoint: str, params: Optional[dict] = None) -> list:
-        """Paginate through all results from an endpoint."""
-        params = params or {}
-        params["per_page"] = 100
-        page = 1
-        results = []
+        """Paginate through all results from an endpoint.
         
-        while True:
-            params["page"] = page
-            data = self._request(endpoint, params)
-            if not data:
-                break
+        Pages are discovered from the Link header. Once the first response
+        names the last page, the remaining pages are fetched concurrently.
+        """
+        params = {**(params or {}), "per_page": 100, "page": 1}
+        data, links = self._request_with_links(endpoint, params)
+        results = list(data)
+        
+        last_page = _link_page(links, "last")
+        if last_page is not None:
+            def fetch(page: int) -> list:
+                data, _ = self._request_with_links(endpoint, {**params, "page": page})
+                return list(data)
+            
+            with ThreadPoolExecutor(
+                max_workers=min(_PAGE_WORKERS, max(1, last_page - 1))
+            ) as executor:
+                for data in executor.map(fetch, range(2, last_page + 1)):
+                    results.extend(data)
+            return results
+        
+        # No last page advertised; follow rel="next" one page at a time
+        next_page = _link_page(links, "next")
+        while next_page is not None:
+            data, links = self._request_with_links(endpoint, {**params, "page": next_page})
             results.extend(data)
-            if len(data) < 100:
-                break
-            page += 1
+            next_page = _link_page(links, "next")
         
         return results
 
+    def _fetch_history(
+        self,
+        full_name: str,
+        ref: str,
+        since_date: Optional[datetime],
+        until_date: Optional[datetime],
+    ) -> Optional[tuple[list, dict]]:
+        """Fetch commit metadata and line stats for a branch via GraphQL.
+        
+        Returns:
+            Tuple of (commits, stats_by_sha) in the shape GitAnalyzer uses, or
+            None if the branch is missing or stats aren't available
+        """
+        owner, name = full_name.split("/", 1)
+        variables = {
+            "owner": owner,
+            "name": name,
+            "ref": ref,
+            "cursor": None,
+            "since": since_date.astimezone().isoformat() if since_date else None,
+            "until": until_date.astimezone().isoformat() if until_date else None,
+        }
+        commits = []
+        stats_by_sha = {}
+        
+        while True:
+            repository = self._graphql(_HISTORY_QUERY, variables)["repository"]
+            if not repository or not repository["ref"]:
+                return None
+            history = repository["ref"]["target"]["history"]
+            
+            for node in history["nodes"]:
+                changed_files = node["changedFilesIfAvailable"]
+                if changed_files is None:
+                    return None
+                author = node["author"] or {}
+                committed_date = datetime.fromisoformat(
+                    node["committedDate"].replace("Z", "+00:00")
+                )
+                commits.append((
+                    node["oid"],
+                    author.get("name") or "",
+                    author.get("email") or "",
+                    int(committed_date.timestamp()),
+                    node["message"],
+                ))
+                stats_by_sha[node["oid"]] = (
+                    node["additions"], node["deletions"], changed_files
+                )
+            
+            if not history["pageInfo"]["hasNextPage"]:
+                return commits, stats_by_sha
+            variables["cursor"] = history["pageInfo"]["endCursor"]
+
+    def _fetch_agents_files(self, full_name: str, ref: str) -> Optional[list[AgentsFileInfo]]:
+        """Find and parse Agents.md files on a branch via the REST API.
+        
+        Returns:
+            List of parsed files, or None if GitHub truncated the recursive
+            tree listing, so files may be missing and a clone is needed
+        """
+        tree = self._request(f"/repos/{full_name}/git/trees/{ref}", {"recursive": "1"})
+        if tree.get("truncated"):
+            return None
+        agents_files = []
+        
+        for entry in tree.get("tree", []):
+            if entry["type"] != "blob" or entry["mode"] == "120000":
+                continue
+            if not _is_agents_path(entry["path"]):
+                continue
+            blob = self._request(f"/repos/{full_name}/git/blobs/{entry['sha']}")
+            info = _parse_agents_file(entry["path"], base64.b64decode(blob["content"]))
+            if info is not None:
+                agents_files.append(info)
+        
+        return agents_files
+
+    def _analyze_via_api(
+        self,
+        repo: dict,
+        branch: Optional[str],
+        since_date: Optional[datetime],
+        until_date: Optional[datetime],
+    ) -> Optional[RepoAnalysis]:
+        """Analyze a repository from the API without cloning it.
+        
+        Returns:
+            RepoAnalysis, or None if the clone-based analysis is needed
+        """
+        ref = branch or repo.get("default_branch")
+        if not ref:
+            return None  # let the clone resolve the repository's HEAD
+        # The tree is checked first: one request settles whether large
+        # repositories need a clone anyway
+        agents_files = self._fetch_agents_files(repo["full_name"], ref)
+        if agents_files is None:
+            return None
+        history = self._fetch_history(repo["full_name"], ref, since_date, until_date)
+        if history is None:
+            return None
+        commits, stats_by_sha = history
+        
+        analyzer = GitAnalyzer(
+            repo_path=repo["clone_url"],
+            branch=ref,
+            since_date=since_date,
+            until_date=until_date,
+        )
+        return analyzer.build_analysis(
+            repo["name"], ref, commits, stats_by_sha, agents_files
+        )
+
+    def _analyze_repo(
+        self,
+        repo: dict,
+        branch: Optional[str],
+        since_date: Optional[datetime],
+        until_date: Optional[datetime],
+    ) -> RepoAnalysis:
+        """Analyze one repository, preferring the API over a clone."""
+        if self.use_graphql:
+            try:
+                analysis = self._analyze_via_api(repo, branch, since_date, until_date)
+                if analysis is not None:
+                    return analysis
+            except (ValueError, KeyError, TypeError, requests.RequestException):
+                # API errors, or a response shaped unlike the query expects
+                # (partial data, null fields); the clone still works
+                pass
+        return _analyze_one(repo, branch, since_date, until_date, self.token)
+
     def get_teams(self) -> list[dict]:
         """Get all teams in the organization.
         
@@ -94,6 +461,14 @@ class GitHubAnalyzer:
         if not self.org:
             raise ValueError("Organization name is required to list team repos")
         
+        if self.use_graphql:
+            try:
+                repos = self._fetch_team_repos(team_slug)
+                if repos is not None:
+                    return repos
+            except (ValueError, KeyError, TypeError, requests.RequestException):
+                pass  # Fall back to the REST listing
+        
         repos = self._paginate(f"/orgs/{self.org}/teams/{team_slug}/repos")
         return [
             {
@@ -106,6 +481,37 @@ class GitHubAnalyzer:
             for r in repos
         ]
 
+    def _fetch_team_repos(self, team_slug: str) -> Optional[list[dict]]:
+        """List a team's repositories via GraphQL, 100 per request.
+        
+        Returns:
+            List of repository dictionaries in the same shape as the REST
+            listing, or None if the team wasn't found
+        """
+        variables = {"org": self.org, "slug": team_slug, "cursor": None}
+        repos = []
+        
+        while True:
+            organization = self._graphql(_TEAM_REPOS_QUERY, variables)["organization"]
+            if not organization or not organization["team"]:
+                return None
+            repositories = organization["team"]["repositories"]
+            
+            for node in repositories["nodes"]:
+                default_branch = node["defaultBranchRef"] or {}
+                repos.append({
+                    "name": node["name"],
+                    "full_name": node["nameWithOwner"],
+                    "clone_url": f"{node['url']}.git",
+                    "private": node["isPrivate"],
+                    "default_branch": default_branch.get("name", "main"),
+                })
+            
+            page_info = repositories["pageInfo"]
+            if not page_info["hasNextPage"]:
+                return repos
+            variables["cursor"] = page_info["endCursor"]
+
     def get_org_repos(self) -> list[dict]:
         """Get all repositories in the organization.
         
@@ -147,46 +553,53 @@ class GitHubAnalyzer:
         Returns:
             MultiRepoAnalysis with aggregated results
         """
-        results: list[RepoAnalysis] = []
         total = len(repos)
+        workers = max(1, min(self.max_workers, total))
+        analyses: dict[int, RepoAnalysis] = {}
         
-        for i, repo in enumerate(repos):
-            if progress_callback:
-                progress_callback(i, total, repo["name"])
-            
-            try:
-                with GitAnalyzer(
-                    repo_path=repo["clone_url"],
-                    branch=branch or repo.get("default_branch"),
-                    since_date=since_date,
-                    until_date=until_date,
-                    github_token=self.token,
-                ) as analyzer:
-                    analysis = analyzer.analyze()
-                    results.append(analysis)
-            except Exception as e:
-                # Log error but continue with other repos
-                print(f"Error analyzing {repo['name']}: {e}")
-                continue
+        # API calls, clones and history walks are I/O bound, so threads
+        # overlap well. Commit analysis stays serial in each thread rather
+        # than starting a process pool per repository.
+        # Completions are consumed here, so the callback runs on this thread.
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    self._analyze_repo, repo, branch, since_date, until_date
+                ): i
+                for i, repo in enumerate(repos)
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                repo = repos[futures[future]]
+                try:
+                    analyses[futures[future]] = future.result()
+                except Exception as e:
+                    # Log error but continue with other repos
+                    print(f"Error analyzing {repo['name']}: {e}")
+                if progress_callback:
+                    progress_callback(done, total, repo["name"])
+        
+        # Keep results in the order the repositories were given
+        results = [analyses[i] for i in sorted(analyses)]
         
         if progress_callback:
             progress_callback(total, total, "Complete")
         
-        # Aggregate results
+        # Aggregate results in a single pass
+        total_commits = 0
+        total_ai_commits = 0
         all_tools = set()
         all_authors = set()
         ai_authors = set()
         
         for r in results:
+            total_commits += r.total_commits
+            total_ai_commits += r.ai_assisted_commits
             all_tools.update(r.tools_detected)
             for author in r.author_stats:
                 all_authors.add(author.name)
                 if author.ai_assisted_commits > 0:
                     ai_authors.add(author.name)
         
-        total_commits = sum(r.total_commits for r in results)
-        total_ai_commits = sum(r.ai_assisted_commits for r in results)
-        
         return MultiRepoAnalysis(
             analyzed_at=datetime.now(),
             repos=results,
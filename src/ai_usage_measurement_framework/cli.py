@@ -3,8 +3,10 @@
 
 """Command-line interface for AI Usage Measurement Framework."""
 
+import heapq
 import os
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional
 
@@ -15,10 +17,6 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
 from ai_usage_measurement_framework import __version__
-from ai_usage_measurement_framework.analyzers.git_analyzer import GitAnalyzer
-from ai_usage_measurement_framework.analyzers.github_analyzer import GitHubAnalyzer
-from ai_usage_measurement_framework.exporters.csv_exporter import CSVExporter
-from ai_usage_measurement_framework.exporters.json_exporter import JSONExporter
 
 app = typer.Typer(
     name="ai-usage-tracker",
@@ -54,11 +52,17 @@ def analyze(
     token: Optional[str] = typer.Option(None, "--token", "-t", envvar="GITHUB_TOKEN", help="GitHub token for private repos"),
     output: Optional[str] = typer.Option(None, "--output", "-o", help="Output file path (JSON or CSV)"),
     format: str = typer.Option("table", "--format", "-f", help="Output format: table, json, csv"),
+    processes: int = typer.Option(1, "--processes", "-p", help="Worker processes for commit analysis (default: 1, serial)"),
+    pretty: bool = typer.Option(False, "--pretty", help="Indent JSON output"),
 ):
     """Analyze a git repository for AI-assisted development."""
+    from ai_usage_measurement_framework.analyzers.git_analyzer import GitAnalyzer
+    from ai_usage_measurement_framework.exporters.csv_exporter import CSVExporter
+    from ai_usage_measurement_framework.exporters.json_exporter import JSONExporter
+    
     # Parse dates
-    since_date = datetime.strptime(since, "%Y-%m-%d") if since else None
-    until_date = datetime.strptime(until, "%Y-%m-%d") if until else None
+    since_date = datetime.fromisoformat(since) if since else None
+    until_date = datetime.fromisoformat(until) if until else None
     
     console.print(Panel.fit(
         f"[bold blue]AI Usage Measurement Framework[/bold blue]\n"
@@ -80,6 +84,7 @@ def analyze(
                 since_date=since_date,
                 until_date=until_date,
                 github_token=token,
+                num_processes=processes,
             ) as analyzer:
                 analysis = analyzer.analyze()
         except Exception as e:
@@ -95,7 +100,7 @@ def analyze(
     if output:
         output_path = Path(output)
         if output_path.suffix == ".json" or format == "json":
-            JSONExporter.export(analysis, output_path)
+            JSONExporter.export(analysis, output_path, indent=2 if pretty else None)
             console.print(f"\n[green]Results exported to:[/green] {output_path}")
         elif output_path.suffix == ".csv" or format == "csv":
             CSVExporter.export_summary(analysis, output_path)
@@ -111,10 +116,17 @@ def team(
     until: Optional[str] = typer.Option(None, "--until", "-u", help="Analyze commits until date (YYYY-MM-DD)"),
     token: str = typer.Option(..., "--token", "-t", envvar="GITHUB_TOKEN", help="GitHub token (required)"),
     output: Optional[str] = typer.Option(None, "--output", "-o", help="Output file path"),
+    jobs: int = typer.Option(8, "--jobs", "-j", min=1, help="Repositories to analyze concurrently"),
+    top: Optional[int] = typer.Option(None, "--top", "-n", min=1, help="Only list the N repositories with the most AI-assisted commits"),
+    pretty: bool = typer.Option(False, "--pretty", help="Indent JSON output"),
 ):
     """Analyze all repositories for a GitHub team."""
-    since_date = datetime.strptime(since, "%Y-%m-%d") if since else None
-    until_date = datetime.strptime(until, "%Y-%m-%d") if until else None
+    from ai_usage_measurement_framework.analyzers.github_analyzer import GitHubAnalyzer
+    from ai_usage_measurement_framework.exporters.csv_exporter import CSVExporter
+    from ai_usage_measurement_framework.exporters.json_exporter import JSONExporter
+    
+    since_date = datetime.fromisoformat(since) if since else None
+    until_date = datetime.fromisoformat(until) if until else None
     
     console.print(Panel.fit(
         f"[bold blue]AI Usage Measurement Framework - Team Analysis[/bold blue]\n"
@@ -124,7 +136,7 @@ def team(
     ))
     
     try:
-        gh = GitHubAnalyzer(token=token, org=org)
+        gh = GitHubAnalyzer(token=token, org=org, max_workers=jobs)
         repos = gh.get_team_repos(team_slug)
         console.print(f"Found [bold]{len(repos)}[/bold] repositories")
     except Exception as e:
@@ -154,13 +166,13 @@ def team(
             raise typer.Exit(1)
     
     # Display results
-    _display_multi_analysis(analysis)
+    _display_multi_analysis(analysis, top=top)
     
     # Export if requested
     if output:
         output_path = Path(output)
         if output_path.suffix == ".json":
-            JSONExporter.export(analysis, output_path)
+            JSONExporter.export(analysis, output_path, indent=2 if pretty else None)
         else:
             CSVExporter.export_summary(analysis, output_path)
         console.print(f"\n[green]Results exported to:[/green] {output_path}")
@@ -172,6 +184,8 @@ def teams(
     token: str = typer.Option(..., "--token", "-t", envvar="GITHUB_TOKEN", help="GitHub token (required)"),
 ):
     """List all teams in a GitHub organization."""
+    from ai_usage_measurement_framework.analyzers.github_analyzer import GitHubAnalyzer
+    
     try:
         gh = GitHubAnalyzer(token=token, org=org)
         teams = gh.get_teams()
@@ -202,7 +216,15 @@ def webapp():
         raise typer.Exit(1)
     
     console.print("[bold blue]Launching AI Usage Measurement Framework Web App...[/bold blue]")
-    subprocess.run([sys.executable, "-m", "streamlit", "run", str(app_path)])
+    try:
+        from streamlit.web import cli as streamlit_cli
+    except ImportError:
+        # Let a separate interpreter find streamlit (or report it missing)
+        subprocess.run([sys.executable, "-m", "streamlit", "run", str(app_path)])
+        return
+    
+    # Serve from this process rather than starting a second interpreter
+    streamlit_cli.main(["run", str(app_path)], prog_name="streamlit")
 
 
 def _display_analysis(analysis):
@@ -226,15 +248,22 @@ def _display_analysis(analysis):
     
     # Show sample detections
     if analysis.detections:
-        console.print("\n[bold]Sample AI-Assisted Commits:[/bold]")
+        lines = ["\n[bold]Sample AI-Assisted Commits:[/bold]"]
         for d in analysis.detections[:5]:
-            console.print(f"  [dim]{d.commit_hash[:8]}[/dim] - {d.author}: {d.message[:60]}...")
+            lines.append(f"  [dim]{d.commit_hash[:8]}[/dim] - {d.author}: {d.message[:60]}...")
             if d.tools_detected:
-                console.print(f"    Tools: [green]{', '.join(d.tools_detected)}[/green]")
+                lines.append(f"    Tools: [green]{', '.join(d.tools_detected)}[/green]")
+        console.print("\n".join(lines))
 
 
-def _display_multi_analysis(analysis):
-    """Display multi-repo analysis results."""
+def _display_multi_analysis(analysis, top: Optional[int] = None):
+    """Display multi-repo analysis results.
+    
+    Args:
+        analysis: The multi-repo analysis to display
+        top: Only list this many repositories, those with the most
+            AI-assisted commits
+    """
     # Summary
     console.print(Panel.fit(
         f"[bold]Total Repositories:[/bold] {analysis.total_repos}\n"
@@ -246,14 +275,20 @@ def _display_multi_analysis(analysis):
     ))
     
     # Per-repo table
+    repos = analysis.repos
+    if top is not None and top < len(repos):
+        repos = heapq.nlargest(top, repos, key=attrgetter("ai_assisted_commits"))
+    
     table = Table(title="Results by Repository")
+    if len(repos) < len(analysis.repos):
+        table.caption = f"Top {len(repos)} of {len(analysis.repos)} repositories by AI-assisted commits"
     table.add_column("Repository", style="cyan")
     table.add_column("Commits", justify="right")
     table.add_column("AI Commits", justify="right")
     table.add_column("AI %", justify="right")
     table.add_column("Tools", style="green")
     
-    for repo in analysis.repos:
+    for repo in repos:
         table.add_row(
             repo.repo_name,
             str(repo.total_commits),
@@ -4,11 +4,40 @@
 """CSV exporter for analysis results."""
 
 import csv
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Union
+from typing import Iterator, Union
 
 from ai_usage_measurement_framework.models import MultiRepoAnalysis, RepoAnalysis
 
+# Rows are buffered in memory and written out in large blocks
+_BUFFER_SIZE = 1 << 20
+
+# Detections are flushed in windows of this many rows, so consumers reading
+# the file as a stream see rows while the export is still running
+_FLUSH_ROWS = 10_000
+
+# Row fields read straight from each model's __dict__, skipping per-field
+# attribute lookups on the pydantic models
+_DETECTION_FIELDS = itemgetter(
+    "commit_hash", "author", "date", "tools_detected", "confidence_score",
+    "confidence_level", "files_changed", "lines_added", "lines_deleted", "message",
+)
+_AUTHOR_FIELDS = itemgetter(
+    "name", "total_commits", "ai_assisted_commits", "ai_percentage", "tools_used",
+)
+_TIMELINE_FIELDS = itemgetter("date", "total_commits", "ai_commits", "ai_percentage")
+
+
+def _iter_repos(analysis: Union[RepoAnalysis, MultiRepoAnalysis]) -> Iterator[RepoAnalysis]:
+    """Yield the per-repository analyses contained in analysis."""
+    if isinstance(analysis, MultiRepoAnalysis):
+        yield from analysis.repos
+    else:
+        yield analysis
+
 
 class CSVExporter:
     """Export analysis results to CSV format."""
@@ -31,7 +60,7 @@ class CSVExporter:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, "w", newline="", encoding="utf-8") as f:
+        with open(output_path, "w", newline="", encoding="utf-8", buffering=_BUFFER_SIZE) as f:
             writer = csv.writer(f)
             
             if isinstance(analysis, MultiRepoAnalysis):
@@ -60,19 +89,25 @@ class CSVExporter:
                     ", ".join(analysis.all_tools_detected),
                 ])
             else:
-                writer.writerow(["Metric", "Value"])
+                # Labels and numbers never need quoting, so those rows are
+                # formatted directly; only user data goes through the writer
+                f.write("Metric,Value\r\n")
                 writer.writerow(["Repository", analysis.repo_name])
                 writer.writerow(["Branch", analysis.branch])
-                writer.writerow(["Total Commits", analysis.total_commits])
-                writer.writerow(["AI-Assisted Commits", analysis.ai_assisted_commits])
-                writer.writerow(["AI Percentage", f"{analysis.ai_percentage}%"])
-                writer.writerow(["Total Authors", analysis.total_authors])
-                writer.writerow(["AI Authors", analysis.ai_authors])
+                f.write(
+                    f"Total Commits,{analysis.total_commits}\r\n"
+                    f"AI-Assisted Commits,{analysis.ai_assisted_commits}\r\n"
+                    f"AI Percentage,{analysis.ai_percentage}%\r\n"
+                    f"Total Authors,{analysis.total_authors}\r\n"
+                    f"AI Authors,{analysis.ai_authors}\r\n"
+                )
                 writer.writerow(["Tools Detected", ", ".join(analysis.tools_detected)])
-                writer.writerow(["High Confidence", analysis.high_confidence_count])
-                writer.writerow(["Medium Confidence", analysis.medium_confidence_count])
-                writer.writerow(["Low Confidence", analysis.low_confidence_count])
-                writer.writerow(["Average Confidence", analysis.average_confidence])
+                f.write(
+                    f"High Confidence,{analysis.high_confidence_count}\r\n"
+                    f"Medium Confidence,{analysis.medium_confidence_count}\r\n"
+                    f"Low Confidence,{analysis.low_confidence_count}\r\n"
+                    f"Average Confidence,{analysis.average_confidence}\r\n"
+                )
         
         return output_path
 
@@ -94,7 +129,7 @@ class CSVExporter:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, "w", newline="", encoding="utf-8") as f:
+        with open(output_path, "w", newline="", encoding="utf-8", buffering=_BUFFER_SIZE) as f:
             writer = csv.writer(f)
             writer.writerow([
                 "Repository", "Commit Hash", "Author", "Date",
@@ -102,37 +137,33 @@ class CSVExporter:
                 "Files Changed", "Lines Added", "Lines Deleted", "Message"
             ])
             
-            if isinstance(analysis, MultiRepoAnalysis):
-                for repo in analysis.repos:
-                    for d in repo.detections:
-                        writer.writerow([
-                            repo.repo_name,
-                            d.commit_hash[:8],
-                            d.author,
-                            d.date.strftime("%Y-%m-%d %H:%M"),
-                            ", ".join(d.tools_detected),
-                            d.confidence_score,
-                            d.confidence_level.value,
-                            d.files_changed,
-                            d.lines_added,
-                            d.lines_deleted,
-                            d.message[:100].replace("\n", " "),
-                        ])
-            else:
-                for d in analysis.detections:
-                    writer.writerow([
-                        analysis.repo_name,
-                        d.commit_hash[:8],
-                        d.author,
-                        d.date.strftime("%Y-%m-%d %H:%M"),
-                        ", ".join(d.tools_detected),
-                        d.confidence_score,
-                        d.confidence_level.value,
-                        d.files_changed,
-                        d.lines_added,
-                        d.lines_deleted,
-                        d.message[:100].replace("\n", " "),
-                    ])
+            # isoformat(" ", "minutes")[:16] equals strftime("%Y-%m-%d %H:%M")
+            # but is several times faster
+            rows = (
+                (
+                    repo.repo_name,
+                    commit_hash[:8],
+                    author,
+                    date.isoformat(" ", "minutes")[:16],
+                    ", ".join(tools),
+                    score,
+                    level.value,
+                    files_changed,
+                    lines_added,
+                    lines_deleted,
+                    message[:100].replace("\n", " "),
+                )
+                for repo in _iter_repos(analysis)
+                for (
+                    commit_hash, author, date, tools, score, level,
+                    files_changed, lines_added, lines_deleted, message,
+                ) in map(_DETECTION_FIELDS, map(vars, repo.detections))
+            )
+            
+            # writerows consumes each window in C, one row at a time
+            while window := list(islice(rows, _FLUSH_ROWS)):
+                writer.writerows(window)
+                f.flush()
         
         return output_path
 
@@ -154,34 +185,20 @@ class CSVExporter:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, "w", newline="", encoding="utf-8") as f:
+        with open(output_path, "w", newline="", encoding="utf-8", buffering=_BUFFER_SIZE) as f:
             writer = csv.writer(f)
             writer.writerow([
                 "Repository", "Author", "Total Commits", "AI Commits",
                 "AI %", "Tools Used"
             ])
             
-            if isinstance(analysis, MultiRepoAnalysis):
-                for repo in analysis.repos:
-                    for author in repo.author_stats:
-                        writer.writerow([
-                            repo.repo_name,
-                            author.name,
-                            author.total_commits,
-                            author.ai_assisted_commits,
-                            author.ai_percentage,
-                            ", ".join(author.tools_used),
-                        ])
-            else:
-                for author in analysis.author_stats:
-                    writer.writerow([
-                        analysis.repo_name,
-                        author.name,
-                        author.total_commits,
-                        author.ai_assisted_commits,
-                        author.ai_percentage,
-                        ", ".join(author.tools_used),
-                    ])
+            writer.writerows(
+                (repo.repo_name, name, total, ai_count, ai_percentage, ", ".join(tools))
+                for repo in _iter_repos(analysis)
+                for name, total, ai_count, ai_percentage, tools in map(
+                    _AUTHOR_FIELDS, map(vars, repo.author_stats)
+                )
+            )
         
         return output_path
 
@@ -203,30 +220,49 @@ class CSVExporter:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, "w", newline="", encoding="utf-8") as f:
+        with open(output_path, "w", newline="", encoding="utf-8", buffering=_BUFFER_SIZE) as f:
             writer = csv.writer(f)
             writer.writerow([
                 "Repository", "Month", "Total Commits", "AI Commits", "AI %"
             ])
             
-            if isinstance(analysis, MultiRepoAnalysis):
-                for repo in analysis.repos:
-                    for entry in repo.timeline:
-                        writer.writerow([
-                            repo.repo_name,
-                            entry.date,
-                            entry.total_commits,
-                            entry.ai_commits,
-                            entry.ai_percentage,
-                        ])
-            else:
-                for entry in analysis.timeline:
-                    writer.writerow([
-                        analysis.repo_name,
-                        entry.date,
-                        entry.total_commits,
-                        entry.ai_commits,
-                        entry.ai_percentage,
-                    ])
+            writer.writerows(
+                (repo.repo_name, *fields)
+                for repo in _iter_repos(analysis)
+                for fields in map(_TIMELINE_FIELDS, map(vars, repo.timeline))
+            )
         
         return output_path
+
+    @classmethod
+    def export_all(
+        cls,
+        analysis: Union[RepoAnalysis, MultiRepoAnalysis],
+        output_dir: Union[str, Path],
+    ) -> dict[str, Path]:
+        """Export summary, detections, authors and timeline CSVs together.
+        
+        The four files are independent, so they are written concurrently.
+        
+        Args:
+            analysis: The analysis results to export
+            output_dir: Directory for summary.csv, detections.csv,
+                authors.csv and timeline.csv
+            
+        Returns:
+            Mapping of export name to the created file's path
+        """
+        output_dir = Path(output_dir)
+        exports = {
+            "summary": cls.export_summary,
+            "detections": cls.export_detections,
+            "authors": cls.export_authors,
+            "timeline": cls.export_timeline,
+        }
+        
+        with ThreadPoolExecutor(max_workers=len(exports)) as executor:
+            futures = {
+                name: executor.submit(export, analysis, output_dir / f"{name}.csv")
+                for name, export in exports.items()
+            }
+            return {name: future.result() for name, future in futures.items()}
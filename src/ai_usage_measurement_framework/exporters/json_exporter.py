@@ -3,13 +3,23 @@
 
 """JSON exporter for analysis results."""
 
+import io
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Union
+from typing import Optional, TextIO, Union
+
+from pydantic import BaseModel
 
 from ai_usage_measurement_framework.models import MultiRepoAnalysis, RepoAnalysis
 
+try:
+    import orjson
+except ImportError:  # optional dependency
+    _HAVE_ORJSON = False
+else:
+    _HAVE_ORJSON = True
+
 
 class JSONExporter:
     """Export analysis results to JSON format."""
@@ -21,19 +31,93 @@ class JSONExporter:
             return obj.isoformat()
         raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
 
+    @classmethod
+    def _dumps(cls, value: object, indent: Optional[int]) -> str:
+        """Encode a plain value, using orjson when it supports the layout.
+        
+        orjson only offers compact output and two-space indentation, so other
+        indents use the json module.
+        """
+        if _HAVE_ORJSON and indent is None:
+            return orjson.dumps(value).decode()
+        if _HAVE_ORJSON and indent == 2:
+            return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode()
+        separators = (",", ":") if indent is None else None
+        return json.dumps(
+            value, indent=indent, separators=separators, default=cls._serialize_datetime
+        )
+
+    @classmethod
+    def _write_value(
+        cls,
+        f: TextIO,
+        value: object,
+        indent: Optional[int],
+        level: int,
+    ) -> None:
+        """Stream a value to f, formatted as json.dump would.
+        
+        Analyses are written field by field and their lists of models (repos,
+        detections, stats, timeline) item by item, so only one item at a time
+        is serialized rather than the whole analysis.
+        
+        Args:
+            f: File to write to
+            value: Model, list or plain JSON-compatible value
+            indent: JSON indentation level
+            level: Nesting depth of value
+        """
+        if isinstance(value, (RepoAnalysis, MultiRepoAnalysis)):
+            key_separator = ":" if indent is None else ": "
+            items = [
+                (json.dumps(name) + key_separator, getattr(value, name))
+                for name in type(value).model_fields
+            ]
+            opener, closer = "{", "}"
+        elif isinstance(value, list) and value and isinstance(value[0], BaseModel):
+            items = [("", item) for item in value]
+            opener, closer = "[", "]"
+        else:
+            if isinstance(value, BaseModel):
+                value = value.model_dump()
+            text = cls._dumps(value, indent)
+            if indent is not None and level:
+                text = text.replace("\n", "\n" + " " * (indent * level))
+            f.write(text)
+            return
+        
+        if not items:
+            f.write(opener + closer)
+            return
+        
+        if indent is None:
+            separator, inner, outer = ",", "", ""
+        else:
+            inner = "\n" + " " * (indent * (level + 1))
+            outer = "\n" + " " * (indent * level)
+            separator = ","
+        
+        f.write(opener)
+        for i, (prefix, item) in enumerate(items):
+            if i:
+                f.write(separator)
+            f.write(inner + prefix)
+            cls._write_value(f, item, indent, level + 1)
+        f.write(outer + closer)
+
     @classmethod
     def export(
         cls,
         analysis: Union[RepoAnalysis, MultiRepoAnalysis],
         output_path: Union[str, Path],
-        indent: int = 2,
+        indent: Optional[int] = None,
     ) -> Path:
         """Export analysis results to a JSON file.
         
         Args:
             analysis: The analysis results to export
             output_path: Path to the output file
-            indent: JSON indentation level
+            indent: JSON indentation level, or None for compact output
             
         Returns:
             Path to the created file
@@ -41,10 +125,8 @@ class JSONExporter:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        data = analysis.model_dump()
-        
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=indent, default=cls._serialize_datetime)
+        with open(output_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            cls._write_value(f, analysis, indent, 0)
         
         return output_path
 
@@ -52,16 +134,17 @@ class JSONExporter:
     def to_string(
         cls,
         analysis: Union[RepoAnalysis, MultiRepoAnalysis],
-        indent: int = 2,
+        indent: Optional[int] = None,
     ) -> str:
         """Convert analysis results to a JSON string.
         
         Args:
             analysis: The analysis results to convert
-            indent: JSON indentation level
+            indent: JSON indentation level, or None for compact output
             
         Returns:
             JSON string representation
         """
-        data = analysis.model_dump()
-        return json.dumps(data, indent=indent, default=cls._serialize_datetime)
+        buffer = io.StringIO()
+        cls._write_value(buffer, analysis, indent, 0)
+        return buffer.getvalue()
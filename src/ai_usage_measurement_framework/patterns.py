@@ -3,8 +3,22 @@
 
 """AI detection patterns for commit message analysis."""
 
+import hashlib
 import re
-from typing import Optional
+import threading
+from functools import lru_cache
+from importlib.metadata import version
+from pathlib import Path
+from typing import Any, Optional, Protocol
+
+from ai_usage_measurement_framework.utils.cache import get_cache_dir, read_entry, write_entry
+
+try:
+    import hyperscan
+except ImportError:  # optional dependency
+    _HAVE_HYPERSCAN = False
+else:
+    _HAVE_HYPERSCAN = True
 
 # AI-related patterns to detect in commit messages
 AI_COMMIT_PATTERNS = [
@@ -119,6 +133,293 @@ GENERIC_AI_PATTERNS: dict[str, dict] = {
 }
 
 
+class _RegexMatcher:
+    """Match groups of patterns using the standard library ``re`` module."""
+
+    def __init__(self, groups: list[list[str]]):
+        # Branches are kept non-capturing: named groups would stop ``re`` from
+        # using its first-character prefilter, which is what makes a single
+        # pass over the text cheaper than one search per pattern.
+        self._combined = re.compile(
+            "|".join(f"(?:{p})" for patterns in groups for p in patterns)
+        )
+        # Plain-literal patterns (most of them) are confirmed with a substring
+        # test; the rest only run the regex engine when the literal they
+        # require is present
+        self._compiled = [
+            (
+                tuple(p for p in patterns if _required_literal(p) == p),
+                [
+                    (_required_literal(p) or "", re.compile(p))
+                    for p in patterns if _required_literal(p) != p
+                ],
+            )
+            for patterns in groups
+        ]
+
+    @staticmethod
+    def prepare(text: str) -> str:
+        """Convert text to the form scan() works on."""
+        return text
+
+    def scan(self, text: str) -> list[int]:
+        """Return the indices of all groups with a pattern occurring in text.
+
+        One search over the combined alternation settles the common no-match
+        case; only texts that match are checked group by group.
+        """
+        if not self._combined.search(text):
+            return []
+        hits = []
+        for i, (literals, regexes) in enumerate(self._compiled):
+            for literal in literals:
+                if literal in text:
+                    hits.append(i)
+                    break
+            else:
+                for hint, regex in regexes:
+                    if hint in text and regex.search(text):
+                        hits.append(i)
+                        break
+        return hits
+
+
+class _HyperscanMatcher:
+    """Match groups of patterns with a single Hyperscan database scan."""
+
+    _FLAGS = (
+        hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+        if _HAVE_HYPERSCAN else 0
+    )
+
+    def __init__(self, groups: list[list[str]]):
+        expressions = [
+            self._translate(p).encode() for patterns in groups for p in patterns
+        ]
+        ids = [i for i, patterns in enumerate(groups) for _ in patterns]
+        
+        # Compiling takes tens of milliseconds, so the serialized database is
+        # kept in the cache for later runs
+        cache_path = None
+        cache_dir = get_cache_dir("patterns")
+        if cache_dir is not None:
+            key = repr((version("hyperscan"), self._FLAGS, expressions, ids))
+            cache_path = cache_dir / f"{hashlib.sha256(key.encode()).hexdigest()}.hsdb"
+        
+        db = self._load(cache_path) if cache_path is not None else None
+        if db is None:
+            db = hyperscan.Database()
+            db.compile(
+                expressions=expressions,
+                ids=ids,
+                elements=len(expressions),
+                flags=[self._FLAGS] * len(expressions),
+            )
+            if cache_path is not None:
+                write_entry(cache_path, bytes(hyperscan.dumpb(db)))
+        self._db = db
+        # Scratch space can't be shared between concurrent scans
+        self._local = threading.local()
+
+    @staticmethod
+    def _load(path: Path) -> Optional["hyperscan.Database"]:
+        """Load a serialized database, or None if there is no usable one."""
+        data = read_entry(path)
+        if data is None:
+            return None
+        try:
+            return hyperscan.loadb(data, hyperscan.HS_MODE_BLOCK)
+        except hyperscan.error:
+            return None  # Corrupt, or built for another platform
+
+    @staticmethod
+    def _translate(pattern: str) -> str:
+        """Adapt a Python pattern to Hyperscan syntax.
+
+        Python's ``\\s`` also matches the \\x1c-\\x1f separator controls,
+        which Unicode ``\\s`` in Hyperscan does not.
+        """
+        pattern = pattern.replace(r"[\s", r"[\s\x1c-\x1f")
+        return re.sub(r"(?<!\[)\\s", r"[\\s\\x1c-\\x1f]", pattern)
+
+    @staticmethod
+    def prepare(text: str) -> bytes:
+        """Convert text to the form scan() works on.
+
+        Encoding once up front lets several matchers scan the same buffer.
+        """
+        return text.encode("utf-8", "replace")
+
+    def scan(self, text: str | bytes) -> list[int]:
+        """Return the indices of all groups with a pattern occurring in text."""
+        if isinstance(text, str):
+            text = self.prepare(text)
+        scratch = getattr(self._local, "scratch", None)
+        if scratch is None:
+            scratch = self._local.scratch = hyperscan.Scratch(self._db)
+
+        hits: set[int] = set()
+
+        def on_match(id_: int, start: int, end: int, flags: int, context: object) -> None:
+            hits.add(id_)
+
+        self._db.scan(
+            text,
+            match_event_handler=on_match,
+            scratch=scratch,
+        )
+        return sorted(hits)
+
+
+class _Matcher(Protocol):
+    """Interface shared by the regex and Hyperscan matchers."""
+
+    def prepare(self, text: str) -> Any: ...
+
+    def scan(self, text: Any) -> list[int]: ...
+
+
+def _required_literal(pattern: str) -> Optional[str]:
+    """Return the longest literal substring every match of pattern contains.
+
+    Only the simple pattern shapes used in this module are understood;
+    None is returned for anything with alternation, groups or counted
+    repetition, meaning no literal can be guaranteed.
+    """
+    if any(c in pattern for c in "|(){}"):
+        return None
+
+    runs = [""]
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "\\":
+            # Escapes like \s stand for a character class, not a literal
+            runs.append("")
+            i += 2
+        elif c == "[":
+            runs.append("")
+            i = pattern.index("]", i + 1) + 1
+        elif c in "*?":
+            # The preceding character is optional
+            runs[-1] = runs[-1][:-1]
+            runs.append("")
+            i += 1
+        elif c == "+":
+            # The preceding character is required but may repeat, so it
+            # ends the run
+            runs.append("")
+            i += 1
+        elif c in ".^$":
+            runs.append("")
+            i += 1
+        else:
+            runs[-1] += c
+            i += 1
+
+    literal = max(runs, key=len)
+    return literal or None
+
+
+def _build_triggers(groups: list[list[str]]) -> Optional[tuple[str, ...]]:
+    """Derive the substrings at least one of which any match must contain.
+
+    Returns:
+        Minimal tuple of trigger substrings, or None if some pattern has no
+        required literal and the prefilter can't be used
+    """
+    literals = set()
+    for patterns in groups:
+        for p in patterns:
+            literal = _required_literal(p)
+            if literal is None:
+                return None
+            literals.add(literal)
+    # A trigger containing another one is redundant
+    return tuple(sorted(
+        t for t in literals
+        if not any(o != t and o in t for o in literals)
+    ))
+
+
+def _build_matcher(groups: list[list[str]]) -> _Matcher:
+    """Build the fastest available matcher for the given pattern groups."""
+    if _HAVE_HYPERSCAN:
+        try:
+            return _HyperscanMatcher(groups)
+        except hyperscan.error:
+            pass
+    return _RegexMatcher(groups)
+
+
+def _has_trigger(text: str, triggers: Optional[tuple[str, ...]]) -> bool:
+    """Cheap substring test ruling out texts no pattern can match."""
+    if triggers is None:
+        return True
+    for t in triggers:
+        if t in text:
+            return True
+    return False
+
+
+# Matchers and score tables built from the public tables by compile_patterns()
+_AI_MATCHER: _Matcher
+_AI_TRIGGERS: Optional[tuple[str, ...]]
+_TOOL_NAMES: list[str]
+_TOOL_SCORES: dict[str, float]
+_TOOL_MATCHER: _Matcher
+_TOOL_TRIGGERS: Optional[tuple[str, ...]]
+_GENERIC_SCORES: dict[str, float]
+_COMPILED_SIZES: tuple[int, int, int]
+
+
+def compile_patterns() -> None:
+    """Build the matchers and score tables from the public pattern tables.
+    
+    Runs at import and whenever the tables grow; call it directly after
+    editing existing entries in place. Memoized detection results are
+    discarded, since they may no longer match the tables.
+    """
+    global _AI_MATCHER, _AI_TRIGGERS, _TOOL_NAMES, _TOOL_SCORES, _TOOL_MATCHER
+    global _TOOL_TRIGGERS, _GENERIC_SCORES, _COMPILED_SIZES
+    
+    ai_groups = [[p] for p in AI_COMMIT_PATTERNS]
+    _AI_MATCHER = _build_matcher(ai_groups)
+    _AI_TRIGGERS = _build_triggers(ai_groups)
+    
+    _TOOL_NAMES = list(TOOL_PATTERNS)
+    tool_groups = [TOOL_PATTERNS[name]["patterns"] for name in _TOOL_NAMES]
+    # Score contribution of each detected tool
+    _TOOL_SCORES = {name: TOOL_PATTERNS[name]["weight"] * 0.5 for name in _TOOL_NAMES}
+    _TOOL_MATCHER = _build_matcher(tool_groups)
+    _TOOL_TRIGGERS = _build_triggers(tool_groups)
+    
+    # Score contribution of each generic AI pattern, keyed by its source string
+    _GENERIC_SCORES = {
+        p: config["weight"] * 0.3
+        for config in GENERIC_AI_PATTERNS.values()
+        for p in config["patterns"]
+    }
+    _COMPILED_SIZES = _pattern_sizes()
+    _detect_ai_usage_cached.cache_clear()
+
+
+def _pattern_sizes() -> tuple[int, int, int]:
+    """Sizes of the public pattern tables, used to notice additions."""
+    return len(AI_COMMIT_PATTERNS), len(TOOL_PATTERNS), len(GENERIC_AI_PATTERNS)
+
+
+def _refresh_patterns() -> None:
+    """Recompile if patterns, tools or generic groups were added.
+    
+    The tables are public and may be extended at runtime; checking their
+    sizes is cheap enough to do on every call. Edits that keep the sizes
+    (such as adding a pattern to an existing tool) need compile_patterns().
+    """
+    if _pattern_sizes() != _COMPILED_SIZES:
+        compile_patterns()
+
+
 def detect_ai_patterns(text: str) -> list[str]:
     """Detect AI-related patterns in text.
     
@@ -128,12 +429,11 @@ def detect_ai_patterns(text: str) -> list[str]:
     Returns:
         List of matched pattern strings
     """
+    _refresh_patterns()
     text_lower = text.lower()
-    detected = []
-    for pattern in AI_COMMIT_PATTERNS:
-        if re.search(pattern, text_lower):
-            detected.append(pattern)
-    return detected
+    if not _has_trigger(text_lower, _AI_TRIGGERS):
+        return []
+    return [AI_COMMIT_PATTERNS[i] for i in _AI_MATCHER.scan(text_lower)]
 
 
 def extract_ai_tools(text: str) -> list[str]:
@@ -145,15 +445,58 @@ def extract_ai_tools(text: str) -> list[str]:
     Returns:
         List of detected tool names
     """
+    _refresh_patterns()
     text_lower = text.lower()
-    tools = []
-    for tool_name, config in TOOL_PATTERNS.items():
-        for pattern in config["patterns"]:
-            if re.search(pattern, text_lower):
-                if tool_name not in tools:
-                    tools.append(tool_name)
-                break
-    return tools
+    if not _has_trigger(text_lower, _TOOL_TRIGGERS):
+        return []
+    return [_TOOL_NAMES[i] for i in _TOOL_MATCHER.scan(text_lower)]
+
+
+def detect_ai_usage(text: str) -> tuple[list[str], list[str]]:
+    """Detect AI patterns and tool names in text in one go.
+    
+    Equivalent to calling detect_ai_patterns and extract_ai_tools, but the
+    text is lowercased and prepared for matching only once, and results for
+    recently seen texts are reused.
+    
+    Args:
+        text: The text to analyze (typically a commit message)
+        
+    Returns:
+        Tuple of (matched pattern strings, detected tool names)
+    """
+    _refresh_patterns()
+    patterns, tools = _detect_ai_usage_cached(text)
+    return list(patterns), list(tools)
+
+
+@lru_cache(maxsize=4096)
+def _detect_ai_usage_cached(text: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Match text against both pattern sets.
+    
+    Histories repeat many messages verbatim (merges, releases, bot
+    commits), so matches are memoized. Tuples keep the cached results from
+    being mutated by callers.
+    """
+    text_lower = text.lower()
+    has_ai = _has_trigger(text_lower, _AI_TRIGGERS)
+    has_tool = _has_trigger(text_lower, _TOOL_TRIGGERS)
+    if not (has_ai or has_tool):
+        return (), ()
+    
+    # Matchers on the same engine share a prepared buffer; a table Hyperscan
+    # can't compile falls back to the regex matcher, which takes str
+    ai_data = _AI_MATCHER.prepare(text_lower)
+    if type(_TOOL_MATCHER) is type(_AI_MATCHER):
+        tool_data = ai_data
+    else:
+        tool_data = _TOOL_MATCHER.prepare(text_lower)
+    patterns = tuple(AI_COMMIT_PATTERNS[i] for i in _AI_MATCHER.scan(ai_data)) if has_ai else ()
+    tools = tuple(_TOOL_NAMES[i] for i in _TOOL_MATCHER.scan(tool_data)) if has_tool else ()
+    return patterns, tools
+
+
+compile_patterns()
 
 
 def calculate_confidence_score(
@@ -177,21 +520,21 @@ def calculate_confidence_score(
     """
     if not patterns_matched:
         return 0.0, "none"
+    _refresh_patterns()
     
     score = 0.0
     
     # Tool-specific patterns have higher weight
     for tool in tools_detected:
-        if tool in TOOL_PATTERNS:
-            score += TOOL_PATTERNS[tool]["weight"] * 0.5
+        contribution = _TOOL_SCORES.get(tool)
+        if contribution is not None:
+            score += contribution
     
     # Generic patterns add lower weight
     for pattern in patterns_matched:
-        for generic_name, config in GENERIC_AI_PATTERNS.items():
-            for p in config["patterns"]:
-                if re.search(p, pattern):
-                    score += config["weight"] * 0.3
-                    break
+        contribution = _GENERIC_SCORES.get(pattern)
+        if contribution is not None:
+            score += contribution
     
     # Bonus for having Agents.md file
     if has_agents_file:
@@ -0,0 +1,111 @@
+# Copyright 2024 AI Usage Measurement Framework Contributors
+# Licensed under the MIT License
+
+"""Opt-in on-disk cache location and entry helpers."""
+
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional
+
+# Environment variable naming the cache root; caching is off when unset
+CACHE_ENV_VAR = "AI_USAGE_CACHE"
+
+# Writes to each directory since it was last checked for eviction
+_writes_since_eviction: dict[Path, int] = {}
+_eviction_lock = threading.Lock()
+
+
+def get_cache_dir(*parts: str) -> Optional[Path]:
+    """Return a cache subdirectory, creating it if needed.
+    
+    Args:
+        *parts: Path components below the cache root
+        
+    Returns:
+        Path to the directory, or None if caching is disabled or the
+        directory can't be created
+    """
+    root = os.environ.get(CACHE_ENV_VAR)
+    if not root:
+        return None
+    
+    path = Path(root).expanduser().joinpath(*parts)
+    try:
+        path.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None  # Unusable cache location; run without caching
+    return path
+
+
+def read_entry(path: Path) -> Optional[bytes]:
+    """Read a cache entry and mark it as recently used.
+    
+    Returns:
+        The cached bytes, or None if there is no entry
+    """
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    try:
+        os.utime(path)
+    except OSError:
+        pass  # Evicted by a concurrent writer since it was read
+    return data
+
+
+def write_entry(path: Path, data: bytes, keep: int = 10) -> None:
+    """Atomically write a cache entry, evicting least recently used siblings.
+    
+    Eviction lists and stats the whole directory, so for large groups it
+    runs on the first write in a process and then once every keep // 10
+    writes; the directory may exceed keep by that many entries meanwhile.
+    
+    Args:
+        path: Entry path; entries in the same directory form one LRU group
+        data: Bytes to store
+        keep: Number of entries to keep in the directory
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        return
+    
+    with _eviction_lock:
+        # A directory not yet seen in this process is checked right away
+        writes = _writes_since_eviction.get(path.parent, -1) + 1
+        due = writes == 0 or writes >= max(1, keep // 10)
+        _writes_since_eviction[path.parent] = 0 if due else writes
+    if not due:
+        return
+    
+    # Other threads or processes may evict entries while we look at them;
+    # those are skipped, as the cache is best effort
+    entries = []
+    try:
+        for p in path.parent.iterdir():
+            if p.name.startswith(".tmp-"):
+                continue
+            try:
+                entries.append((p.stat().st_mtime, p))
+            except OSError:
+                continue
+    except OSError:
+        return
+    entries.sort(reverse=True)
+    for _, stale in entries[keep:]:
+        try:
+            stale.unlink()
+        except OSError:
+            pass
@@ -1,16 +1,30 @@
 import streamlit as st
+import hashlib
+import json
 import os
-import re
 import tempfile
 import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, date
 from collections import defaultdict
+from urllib.parse import parse_qs, urlparse
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from git import Repo
-from git.exc import InvalidGitRepositoryError, NoSuchPathError
+from git.exc import GitCommandError, InvalidGitRepositoryError, NoSuchPathError
 import requests
+from requests.adapters import HTTPAdapter
+
+from ai_usage_measurement_framework import __version__
+from ai_usage_measurement_framework.analyzers.git_analyzer import _fetch_mirror, _sum_numstat
+from ai_usage_measurement_framework.patterns import (
+    detect_ai_usage,
+    extract_ai_tools,
+)
+from ai_usage_measurement_framework.utils.cache import get_cache_dir, read_entry, write_entry
 
 st.set_page_config(
     page_title="AI Usage Measurement Framework",
@@ -40,87 +54,139 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# AI-related patterns to detect in commit messages
-AI_COMMIT_PATTERNS = [
-    # GitHub Copilot patterns
-    r"copilot",
-    r"github\s*copilot",
-    r"co-authored-by:.*copilot",
-    r"generated\s*by\s*copilot",
-    
-    # Windsurf/Codeium patterns
-    r"windsurf",
-    r"codeium",
-    r"cascade",
-    
-    # General AI patterns
-    r"ai[\s-]*generated",
-    r"ai[\s-]*assisted",
-    r"auto[\s-]*generated",
-    r"machine[\s-]*generated",
-    r"llm[\s-]*generated",
-    r"gpt[\s-]*generated",
-    r"claude",
-    r"chatgpt",
-    r"openai",
-    r"anthropic",
-    
-    # Common AI tool signatures
-    r"devin",
-    r"cursor",
-    r"tabnine",
-    r"kite",
-    r"codex",
-    r"amazon\s*q",
-    r"cody",
-    
-    # AI-assisted commit message patterns
-    r"refactor.*ai",
-    r"fix.*suggested\s*by",
-    r"implement.*generated",
-]
-
-TOOL_PATTERNS = {
-    "GitHub Copilot": [r"copilot", r"github\s*copilot"],
-    "Windsurf": [r"windsurf"],
-    "Codeium": [r"codeium"],
-    "Cascade": [r"cascade"],
-    "Cursor": [r"cursor"],
-    "ChatGPT": [r"chatgpt", r"gpt-4", r"gpt-3"],
-    "Claude": [r"claude", r"anthropic"],
-    "Devin": [r"devin"],
-    "Amazon Q": [r"amazon\s*q"],
-    "Tabnine": [r"tabnine"],
-    "Cody": [r"cody"],
-}
+# Directories that are never searched for Agents.md files
+_SKIP_DIRS = frozenset((".git", "node_modules", ".venv", "venv", "__pycache__"))
+
+# File names (lowercased) recognised as Agents.md files
+_AGENTS_FILENAMES = frozenset(("agents.md", ".agents.md", "agent.md"))
+
+
+# Keep-alive session shared by all GitHub API calls
+_GITHUB_SESSION = requests.Session()
+_GITHUB_SESSION.headers.update({"Accept": "application/vnd.github+json"})
+_GITHUB_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
 
+# Concurrent requests when fetching the remaining pages of a listing
+_GITHUB_PAGE_WORKERS = 6
 
-def detect_ai_patterns(text: str) -> list[str]:
-    """Detect AI-related patterns in text."""
-    text_lower = text.lower()
-    detected = []
-    for pattern in AI_COMMIT_PATTERNS:
-        if re.search(pattern, text_lower):
-            detected.append(pattern)
-    return detected
+# Last response per (token, URL, params), revalidated with its ETag. Kept
+# at module level because pages are fetched on worker threads.
+_GITHUB_ETAG_CACHE: dict[tuple, requests.Response] = {}
+_GITHUB_ETAG_ENTRIES = 500
+_GITHUB_ETAG_LOCK = threading.Lock()
+
+
+def _github_get(url: str, token: str, params: dict = None) -> requests.Response:
+    """GET a GitHub API URL, revalidating an earlier response by its ETag.
+    
+    GitHub answers an unchanged resource with 304 Not Modified, which has
+    no body and does not count against the rate limit; the earlier
+    response is returned in its place.
+    """
+    cache_key = (
+        hashlib.sha256(token.encode()).hexdigest(),
+        url,
+        tuple(sorted((params or {}).items())),
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+    cached = _GITHUB_ETAG_CACHE.get(cache_key)
+    if cached is not None:
+        headers["If-None-Match"] = cached.headers["ETag"]
+    
+    resp = _GITHUB_SESSION.get(url, headers=headers, params=params)
+    if resp.status_code == 304 and cached is not None:
+        return cached
+    if resp.status_code == 200 and "ETag" in resp.headers:
+        with _GITHUB_ETAG_LOCK:
+            _GITHUB_ETAG_CACHE.pop(cache_key, None)
+            _GITHUB_ETAG_CACHE[cache_key] = resp
+            while len(_GITHUB_ETAG_CACHE) > _GITHUB_ETAG_ENTRIES:
+                del _GITHUB_ETAG_CACHE[next(iter(_GITHUB_ETAG_CACHE))]
+    return resp
+
+
+def _iter_github_pages(url: str, token: str):
+    """Yield the response for each page of a GitHub listing endpoint.
+    
+    Pages are discovered from the Link header, so iteration stops at the
+    last page without requesting an empty one. Once the first response
+    names the last page, the remaining pages are fetched concurrently and
+    yielded in order.
+    """
+    params = {"per_page": 100}
+    resp = _github_get(url, token, params)
+    yield resp
+    
+    last_url = resp.links.get("last", {}).get("url")
+    pages = parse_qs(urlparse(last_url).query).get("page") if last_url else None
+    if pages:
+        last_page = int(pages[0])
+        
+        def fetch(page: int):
+            return _github_get(url, token, {**params, "page": page})
+        
+        with ThreadPoolExecutor(
+            max_workers=min(_GITHUB_PAGE_WORKERS, max(1, last_page - 1))
+        ) as executor:
+            yield from executor.map(fetch, range(2, last_page + 1))
+        return
+    
+    # No last page advertised; follow rel="next" one page at a time. The
+    # next page URL already carries the query string.
+    next_url = resp.links.get("next", {}).get("url")
+    while next_url:
+        resp = _github_get(next_url, token)
+        yield resp
+        next_url = resp.links.get("next", {}).get("url")
+
+
+# Analysis results kept per browser session for re-display
+_SESSION_RESULTS = 5
+
+# Minimum seconds between progress updates while scanning commits
+_PROGRESS_INTERVAL = 0.1
+
+# Teams of an organization together with their first 100 repositories
+_ORG_TEAMS_QUERY = """
+query($org: String!, $cursor: String) {
+  organization(login: $org) {
+    teams(first: 100, after: $cursor) {
+      nodes {
+        name
+        slug
+        databaseId
+        repositories(first: 100) {
+          nodes { name nameWithOwner url isPrivate }
+          pageInfo { endCursor hasNextPage }
+        }
+      }
+      pageInfo { endCursor hasNextPage }
+    }
+  }
+}
+"""
+
+# Further repositories of one team, 100 per page
+_TEAM_REPOS_QUERY = """
+query($org: String!, $slug: String!, $cursor: String) {
+  organization(login: $org) {
+    team(slug: $slug) {
+      repositories(first: 100, after: $cursor) {
+        nodes { name nameWithOwner url isPrivate }
+        pageInfo { endCursor hasNextPage }
+      }
+    }
+  }
+}
+"""
 
 
 # GitHub API functions
 @st.cache_data(ttl=300)
 def get_github_teams(org: str, token: str) -> list[dict]:
     """Fetch teams for a GitHub organization."""
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Accept": "application/vnd.github+json"
-    }
     teams = []
-    page = 1
-    while True:
-        resp = requests.get(
-            f"https://api.github.com/orgs/{org}/teams",
-            headers=headers,
-            params={"per_page": 100, "page": page}
-        )
+    for resp in _iter_github_pages(f"https://api.github.com/orgs/{org}/teams", token):
         if resp.status_code == 401:
             raise ValueError("Invalid GitHub token. Please check your token and try again.")
         if resp.status_code == 403:
@@ -130,11 +196,7 @@ def get_github_teams(org: str, token: str) -> list[dict]:
         if resp.status_code != 200:
             raise ValueError(f"GitHub API error: {resp.status_code} - {resp.text}")
         
-        data = resp.json()
-        if not data:
-            break
-        teams.extend(data)
-        page += 1
+        teams.extend(resp.json())
     
     return [{"name": t["name"], "slug": t["slug"], "id": t["id"]} for t in teams]
 
@@ -142,47 +204,248 @@ def get_github_teams(org: str, token: str) -> list[dict]:
 @st.cache_data(ttl=300)
 def get_team_repos(org: str, team_slug: str, token: str) -> list[dict]:
     """Fetch repositories for a GitHub team."""
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Accept": "application/vnd.github+json"
-    }
     repos = []
-    page = 1
-    while True:
-        resp = requests.get(
-            f"https://api.github.com/orgs/{org}/teams/{team_slug}/repos",
-            headers=headers,
-            params={"per_page": 100, "page": page}
-        )
+    for resp in _iter_github_pages(f"https://api.github.com/orgs/{org}/teams/{team_slug}/repos", token):
         if resp.status_code != 200:
             raise ValueError(f"Failed to fetch team repos: {resp.status_code}")
         
-        data = resp.json()
-        if not data:
-            break
-        repos.extend(data)
-        page += 1
+        repos.extend(resp.json())
     
     return [{"name": r["name"], "full_name": r["full_name"], "clone_url": r["clone_url"], "private": r["private"]} for r in repos]
 
 
-def extract_ai_tools_from_text(text: str) -> list[str]:
-    """Extract specific AI tool names from text."""
-    text_lower = text.lower()
-    tools = []
-    for tool_name, patterns in TOOL_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, text_lower):
-                if tool_name not in tools:
-                    tools.append(tool_name)
-                break
-    return tools
+def _github_graphql(query: str, variables: dict, token: str):
+    """Run a GitHub GraphQL query.
+    
+    Returns:
+        The response data, or None if the query failed
+    """
+    resp = _GITHUB_SESSION.post(
+        "https://api.github.com/graphql",
+        json={"query": query, "variables": variables},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    if resp.status_code != 200:
+        return None
+    body = resp.json()
+    if body.get("errors"):
+        return None
+    return body["data"]
+
+
+def _graphql_repo(node: dict) -> dict:
+    """Convert a GraphQL repository node to the REST listing's fields."""
+    return {
+        "name": node["name"],
+        "full_name": node["nameWithOwner"],
+        "clone_url": f"{node['url']}.git",
+        "private": node["isPrivate"],
+    }
 
 
 @st.cache_data(ttl=300)
-def analyze_git_repo(repo_path: str, branch: str = None, since_date: str = None, until_date: str = None, token: str = None):
-    """Analyze a git repository for AI usage patterns."""
+def get_org_teams_with_repos(org: str, token: str):
+    """Fetch an organization's teams and their repositories via GraphQL.
+    
+    One query returns up to 100 teams with their first 100 repositories
+    each, replacing a REST listing of teams plus one per team. Teams with
+    more repositories are completed with follow-up queries.
+    
+    Returns:
+        List of team dictionaries with a "repos" list, or None if GraphQL
+        is unavailable (the REST functions then report the reason)
+    """
+    teams = []
+    variables = {"org": org, "cursor": None}
+    while True:
+        data = _github_graphql(_ORG_TEAMS_QUERY, variables, token)
+        if not data or not data["organization"]:
+            return None
+        connection = data["organization"]["teams"]
+        
+        for node in connection["nodes"]:
+            repositories = node["repositories"]
+            repos = [_graphql_repo(r) for r in repositories["nodes"]]
+            repo_vars = {"org": org, "slug": node["slug"]}
+            while repositories["pageInfo"]["hasNextPage"]:
+                repo_vars["cursor"] = repositories["pageInfo"]["endCursor"]
+                data = _github_graphql(_TEAM_REPOS_QUERY, repo_vars, token)
+                if not data or not data["organization"] or not data["organization"]["team"]:
+                    return None
+                repositories = data["organization"]["team"]["repositories"]
+                repos.extend(_graphql_repo(r) for r in repositories["nodes"])
+            
+            teams.append({
+                "name": node["name"],
+                "slug": node["slug"],
+                "id": node["databaseId"],
+                "repos": repos,
+            })
+        
+        if not connection["pageInfo"]["hasNextPage"]:
+            return teams
+        variables["cursor"] = connection["pageInfo"]["endCursor"]
+
+
+def _clone_repo(clone_url: str, temp_dir: str, branch: str = None, since_date: str = None) -> Repo:
+    """Clone only what the analysis reads.
+    
+    The clone is blobless and limited to one branch: commit messages and
+    trees come down with the clone, while file contents are fetched on
+    demand for the checkout and the sample commit stats. With a since date
+    only the history in the window is fetched, deepened by one commit so
+    the oldest commits in the window still have their parents.
+    
+    Args:
+        clone_url: URL to clone from
+        temp_dir: Empty directory to clone into
+        branch: Branch to clone (default: the remote's default branch)
+        since_date: Only fetch commits after this date
+        
+    Returns:
+        The cloned repository
+    """
+    options = ["--filter=blob:none", "--single-branch", "--no-tags"]
+    if branch:
+        options.append(f"--branch={branch}")
+    if since_date:
+        try:
+            repo = Repo.clone_from(
+                clone_url, temp_dir, multi_options=options + [f"--shallow-since={since_date}"]
+            )
+            repo.git.fetch("--deepen=1")
+            return repo
+        except GitCommandError:
+            # e.g. no commits in the window; fall back to the whole history
+            shutil.rmtree(temp_dir)
+            os.makedirs(temp_dir)
+    return Repo.clone_from(clone_url, temp_dir, multi_options=options)
+
+
+def _find_agents_md(root: str):
+    """Yield directory entries for Agents.md files below root.
+    
+    Skipped directories are pruned rather than walked and filtered, and
+    entries come in the same order as an os.walk of the tree.
+    """
+    stack = [root]
+    while stack:
+        subdirs = []
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _SKIP_DIRS:
+                        subdirs.append(entry.path)
+                elif entry.name.lower() in _AGENTS_FILENAMES:
+                    yield entry
+        stack.extend(reversed(subdirs))
+
+
+def _iter_commit_records(repo: Repo, **kwargs):
+    """Stream (sha, author, committer ISO date, message) records from git log.
+    
+    Records are decoded as they arrive, so memory use does not grow with
+    the length of the history.
+    
+    Args:
+        repo: Repository to read
+        **kwargs: Extra git log options, e.g. since/until
+    """
+    proc = repo.git.log("-z", "--format=%H%x1f%an%x1f%cI%x1f%B", as_process=True, **kwargs)
+    popen = proc.proc
+    try:
+        pending = b""
+        for chunk in iter(lambda: proc.stdout.read(1 << 16), b""):
+            records = (pending + chunk).split(b"\0")
+            pending = records.pop()
+            for record in records:
+                yield record.decode("utf-8", "surrogateescape").split("\x1f", 3)
+        proc.wait()
+    finally:
+        # Reap git log right away if the caller stopped early or the loop
+        # raised, rather than leaving the process and pipes to the GC
+        for stream in (popen.stdout, popen.stderr):
+            if stream is not None:
+                stream.close()
+        if popen.poll() is None:
+            popen.kill()
+        popen.wait()
+
+
+def _commit_stats(repo: Repo, shas: list[str]) -> dict[str, tuple[int, int, int]]:
+    """Read diff stats for the given commits with one git log call.
+    
+    Merge commits are diffed against their first parent and renames are
+    not detected, matching GitPython's `Commit.stats`.
+    
+    Returns:
+        Mapping of sha to (insertions, deletions, files_changed)
+    """
+    raw = repo.git.log(
+        "--no-walk=unsorted",
+        "--numstat",
+        "--no-renames",
+        "--diff-merges=first-parent",
+        "--format=%x1e%H",
+        *shas,
+        no_color=True,
+    )
+    stats = {}
+    for record in raw.split("\x1e")[1:]:
+        sha, _, numstat = record.partition("\n")
+        stats[sha] = _sum_numstat(numstat)
+    return stats
+
+
+def _result_cache_path(repo_path: str, repo: Repo, branch: str = None, since_date: str = None, until_date: str = None):
+    """Locate the cached result for the checked-out revision and filters.
+    
+    Returns:
+        Cache entry path, or None if caching is disabled or the working
+        tree has local changes the result would depend on
+    """
+    cache_root = get_cache_dir("webapp")
+    if cache_root is None or repo.is_dirty(untracked_files=True):
+        return None
+    
+    source = repo_path
+    if not (repo_path.startswith("http") or repo_path.startswith("git@")):
+        source = os.path.abspath(os.path.expanduser(repo_path))
+    key = "\0".join((
+        __version__, source, str(branch), repo.head.commit.hexsha,
+        str(since_date), str(until_date),
+    ))
+    # One directory per repository, so eviction is per repository
+    repo_dir = hashlib.sha256(source.encode()).hexdigest()[:16]
+    return cache_root / repo_dir / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+
+def _ignore_progress(fraction: float, message: str) -> None:
+    """Progress callback used when the caller doesn't want updates."""
+
+
+def _analyze_repo_worker(repo_path: str, branch: str = None, since_date: str = None, until_date: str = None, token: str = None, progress=None, refresh: bool = False):
+    """Analyze a git repository for AI usage patterns.
+    
+    Does not touch Streamlit, so it can run on worker threads. Errors are
+    raised to the caller.
+    
+    Args:
+        repo_path: Local path or clone URL of the repository
+        branch: Branch to check out before analyzing
+        since_date: Only analyze commits after this date
+        until_date: Only analyze commits before this date
+        token: GitHub token used to clone private repositories
+        progress: Optional callback(fraction, message) for progress updates
+        refresh: Analyze again even if a result for this revision is cached
+        
+    Returns:
+        Dictionary with the analysis results
+    """
     temp_dir = None
+    mirror = None
+    if progress is None:
+        progress = _ignore_progress
     
     try:
         # Handle GitHub URLs
@@ -194,122 +457,135 @@ def analyze_git_repo(repo_path: str, branch: str = None, since_date: str = None,
             if token and "github.com" in repo_path:
                 clone_url = repo_path.replace("https://github.com", f"https://{token}@github.com")
             
-            with st.spinner(f"Cloning repository..."):
-                repo = Repo.clone_from(clone_url, temp_dir)
+            mirror_root = get_cache_dir("mirrors")
+            if mirror_root is not None:
+                # Refresh the persistent mirror (shared with the CLI) and
+                # check the branch out into a throwaway worktree
+                progress(0, "Updating repository mirror...")
+                mirror = Repo(_fetch_mirror(repo_path, clone_url, mirror_root))
+                mirror.git.worktree("add", "--detach", temp_dir, branch or "HEAD")
+                repo = Repo(temp_dir)
+            else:
+                progress(0, "Cloning repository...")
+                repo = _clone_repo(clone_url, temp_dir, branch, since_date)
             actual_path = temp_dir
             repo_name = repo_path.split("/")[-1].replace(".git", "")
         else:
             actual_path = os.path.expanduser(repo_path)
             repo = Repo(actual_path)
             repo_name = os.path.basename(actual_path)
+            if branch:
+                repo.git.checkout(branch)
         
-        if branch:
-            repo.git.checkout(branch)
+        # Reuse a previous result for the same revision if one is cached
+        cache_path = _result_cache_path(repo_path, repo, branch, since_date, until_date)
+        if cache_path is not None and not refresh:
+            cached = read_entry(cache_path)
+            if cached is not None:
+                return json.loads(cached)
         
-        # Build commit iterator with date filters
+        # Stream every commit from one git log call instead of building one
+        # GitPython object (and object lookup) per commit
         kwargs = {}
         if since_date:
             kwargs["since"] = since_date
         if until_date:
             kwargs["until"] = until_date
         
-        commits = list(repo.iter_commits(**kwargs))
+        # Counting is much cheaper than the log itself and gives the
+        # progress bar its total up front
+        expected_commits = int(repo.git.rev_list("--count", "HEAD", **kwargs)) or 1
         
-        total_commits = len(commits)
+        total_commits = 0
         ai_assisted_commits = 0
         commits_by_author = defaultdict(int)
         ai_commits_by_author = defaultdict(int)
         ai_commits_timeline = defaultdict(int)
         all_ai_tools = set()
         sample_ai_commits = []
+        sample_shas = []
         
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-        
-        for i, commit in enumerate(commits):
-            if i % 100 == 0:
-                progress_bar.progress(min(i / total_commits, 1.0))
-                status_text.text(f"Analyzing commit {i+1} of {total_commits}...")
+        last_progress = float("-inf")
+        for sha, author, committed_date, message in _iter_commit_records(repo, **kwargs):
+            # Throttle by time: every update is a round-trip to the browser
+            now = time.monotonic()
+            if now - last_progress >= _PROGRESS_INTERVAL:
+                last_progress = now
+                progress(
+                    min(total_commits / expected_commits, 1.0),
+                    f"Analyzing commit {total_commits+1} of {expected_commits}...",
+                )
+            total_commits += 1
             
-            author = commit.author.name if commit.author else "Unknown"
             commits_by_author[author] += 1
             
             # Check commit message for AI patterns
-            ai_indicators = detect_ai_patterns(commit.message)
-            ai_tools = extract_ai_tools_from_text(commit.message)
+            ai_indicators, ai_tools = detect_ai_usage(message)
             
             if ai_indicators:
                 ai_assisted_commits += 1
                 ai_commits_by_author[author] += 1
                 
                 # Group by month for timeline
-                month_key = commit.committed_datetime.strftime("%Y-%m")
+                month_key = committed_date[:7]
                 ai_commits_timeline[month_key] += 1
                 
                 all_ai_tools.update(ai_tools)
                 
-                # Collect sample AI commits (up to 20)
+                # Collect sample AI commits (up to 20); stats are filled in below
                 if len(sample_ai_commits) < 20:
-                    try:
-                        stats = commit.stats.total
-                        files_changed = stats.get("files", 0)
-                        insertions = stats.get("insertions", 0)
-                        deletions = stats.get("deletions", 0)
-                    except Exception:
-                        files_changed = 0
-                        insertions = 0
-                        deletions = 0
-                    
+                    sample_shas.append(sha)
                     sample_ai_commits.append({
-                        "sha": commit.hexsha[:8],
-                        "message": commit.message[:200],
+                        "sha": sha[:8],
+                        "message": message[:200],
                         "author": author,
-                        "date": commit.committed_datetime.isoformat(),
+                        "date": committed_date,
                         "ai_indicators": ai_indicators,
-                        "files_changed": files_changed,
-                        "insertions": insertions,
-                        "deletions": deletions,
+                        "files_changed": 0,
+                        "insertions": 0,
+                        "deletions": 0,
                     })
         
-        progress_bar.progress(1.0)
-        status_text.text("Scanning for Agents.md files...")
+        if sample_shas:
+            try:
+                stats_by_sha = _commit_stats(repo, sample_shas)
+            except Exception:
+                stats_by_sha = {}
+            for sha, sample in zip(sample_shas, sample_ai_commits):
+                if sha in stats_by_sha:
+                    insertions, deletions, files_changed = stats_by_sha[sha]
+                    sample["files_changed"] = files_changed
+                    sample["insertions"] = insertions
+                    sample["deletions"] = deletions
+        
+        progress(1.0, "Scanning for Agents.md files...")
         
         # Find and analyze Agents.md files
         agents_md_files = []
-        for root, dirs, files in os.walk(actual_path):
-            # Skip .git directory
-            if ".git" in root:
-                continue
-            for file in files:
-                if file.lower() in ["agents.md", "agent.md", ".agents.md"]:
-                    file_path = os.path.join(root, file)
-                    rel_path = os.path.relpath(file_path, actual_path)
-                    try:
-                        with open(file_path, "r", encoding="utf-8") as f:
-                            content = f.read()
-                        
-                        ai_tools = extract_ai_tools_from_text(content)
-                        all_ai_tools.update(ai_tools)
-                        
-                        # Get last modified time
-                        mtime = os.path.getmtime(file_path)
-                        last_modified = datetime.fromtimestamp(mtime).isoformat()
-                        
-                        agents_md_files.append({
-                            "file_path": rel_path,
-                            "content": content[:2000],
-                            "ai_tools_mentioned": ai_tools,
-                            "last_modified": last_modified,
-                        })
-                    except Exception:
-                        pass
-        
-        status_text.empty()
-        progress_bar.empty()
+        for entry in _find_agents_md(actual_path):
+            rel_path = os.path.relpath(entry.path, actual_path)
+            try:
+                with open(entry.path, "r", encoding="utf-8") as f:
+                    content = f.read()
+                
+                ai_tools = extract_ai_tools(content)
+                all_ai_tools.update(ai_tools)
+                
+                # Get last modified time
+                last_modified = datetime.fromtimestamp(entry.stat().st_mtime).isoformat()
+                
+                agents_md_files.append({
+                    "file_path": rel_path,
+                    "content": content[:2000],
+                    "ai_tools_mentioned": ai_tools,
+                    "last_modified": last_modified,
+                })
+            except Exception:
+                pass
         
         ai_percentage = (ai_assisted_commits / total_commits * 100) if total_commits > 0 else 0
         
-        return {
+        result = {
             "repo_name": repo_name,
             "total_commits": total_commits,
             "ai_assisted_commits": ai_assisted_commits,
@@ -322,49 +598,100 @@ def analyze_git_repo(repo_path: str, branch: str = None, since_date: str = None,
             "sample_ai_commits": sample_ai_commits,
             "analysis_date": datetime.now().isoformat(),
         }
-        
-    except InvalidGitRepositoryError:
+        if cache_path is not None:
+            write_entry(cache_path, json.dumps(result).encode())
+        return result
+    finally:
+        if temp_dir and os.path.exists(temp_dir):
+            shutil.rmtree(temp_dir)
+        if mirror is not None:
+            mirror.git.worktree("prune")
+
+
+def _report_analysis_error(repo_path: str, error: Exception):
+    """Show why a repository could not be analyzed."""
+    if isinstance(error, InvalidGitRepositoryError):
         st.error(f"Invalid git repository: {repo_path}")
-        return None
-    except NoSuchPathError:
+    elif isinstance(error, NoSuchPathError):
         st.error(f"Repository path not found: {repo_path}")
-        return None
+    else:
+        st.error(f"Error analyzing repository: {str(error)}")
+
+
+@st.cache_data(ttl=300)
+def analyze_git_repo(repo_path: str, branch: str = None, since_date: str = None, until_date: str = None, token: str = None):
+    """Analyze a git repository for AI usage patterns."""
+    return _analyze_with_progress(repo_path, branch, since_date, until_date, token)
+
+
+def _analyze_with_progress(repo_path: str, branch: str = None, since_date: str = None, until_date: str = None, token: str = None, refresh: bool = False):
+    """Analyze one repository with a progress bar, reporting errors in the app.
+    
+    Not cached, so a forced refresh can bypass analyze_git_repo's cache.
+    """
+    progress_bar = st.progress(0)
+    status_text = st.empty()
+    
+    def report(fraction, message):
+        progress_bar.progress(fraction)
+        status_text.text(message)
+    
+    try:
+        return _analyze_repo_worker(
+            repo_path, branch, since_date, until_date, token, progress=report, refresh=refresh
+        )
     except Exception as e:
-        st.error(f"Error analyzing repository: {str(e)}")
+        _report_analysis_error(repo_path, e)
         return None
     finally:
-        if temp_dir and os.path.exists(temp_dir):
-            shutil.rmtree(temp_dir)
+        status_text.empty()
+        progress_bar.empty()
 
 
-def analyze_multiple_repos(repos: list, branch: str = None, since_date: str = None, until_date: str = None, token: str = None):
+def analyze_multiple_repos(repos: list, branch: str = None, since_date: str = None, until_date: str = None, token: str = None, refresh: bool = False):
     """Analyze multiple repositories and aggregate results."""
-    all_results = []
+    results = {}
     
-    progress_container = st.container()
-    with progress_container:
+    # Each repository is reported as soon as it finishes, so fast ones
+    # show up while slower clones are still running
+    with st.status(f"Analyzing {len(repos)} repositories...", expanded=True) as status:
         overall_progress = st.progress(0)
-        repo_status = st.empty()
-    
-    for i, repo in enumerate(repos):
-        repo_status.text(f"Analyzing {repo['name']} ({i+1}/{len(repos)})...")
-        overall_progress.progress((i) / len(repos))
-        
-        result = analyze_git_repo(
-            repo['clone_url'],
-            branch=branch,
-            since_date=since_date,
-            until_date=until_date,
-            token=token
-        )
         
-        if result:
-            result['repo_full_name'] = repo.get('full_name', repo['name'])
-            all_results.append(result)
+        # Clones and history walks are mostly spent in git subprocesses, so
+        # threads overlap well. Streamlit calls stay on this thread.
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(repos)))) as executor:
+            futures = {
+                executor.submit(
+                    _analyze_repo_worker, repo['clone_url'], branch, since_date, until_date, token,
+                    refresh=refresh,
+                ): i
+                for i, repo in enumerate(repos)
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                repo = repos[futures[future]]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    _report_analysis_error(repo['clone_url'], e)
+                else:
+                    result['repo_full_name'] = repo.get('full_name', repo['name'])
+                    results[futures[future]] = result
+                    st.write(
+                        f"✅ {repo['name']}: {result['ai_assisted_commits']} of "
+                        f"{result['total_commits']} commits AI-assisted"
+                    )
+                status.update(label=f"Analyzed {repo['name']} ({done}/{len(repos)})...")
+                overall_progress.progress(done / len(repos))
+        
+        overall_progress.empty()
+        status.update(
+            label=f"Analyzed {len(results)} of {len(repos)} repositories",
+            state="complete" if results else "error",
+            expanded=len(results) < len(repos),
+        )
     
-    overall_progress.progress(1.0)
-    repo_status.empty()
-    overall_progress.empty()
+    # Keep results in the order the repositories were given
+    all_results = [results[i] for i in sorted(results)]
     
     if not all_results:
         return None
@@ -415,6 +742,26 @@ def analyze_multiple_repos(repos: list, branch: str = None, since_date: str = No
     return aggregated
 
 
+def _session_key(*inputs) -> str:
+    """Key session state entries by the inputs that produced them.
+    
+    The inputs include the token, so they are hashed rather than kept.
+    """
+    return hashlib.blake2b(repr(inputs).encode(), digest_size=16).hexdigest()
+
+
+def _remember_result(result_cache: dict, key: str, result: dict) -> None:
+    """Store a result in the session, keeping only the most recent ones.
+    
+    Results carry per-author counts and Agents.md contents, so only the
+    last _SESSION_RESULTS analyses are kept for quick re-display.
+    """
+    result_cache.pop(key, None)
+    result_cache[key] = result
+    while len(result_cache) > _SESSION_RESULTS:
+        del result_cache[next(iter(result_cache))]
+
+
 def render_single_repo_details(repo_result, expanded=False):
     """Render detailed view for a single repository in drill-down mode."""
     repo_name = repo_result.get('repo_full_name', repo_result['repo_name'])
@@ -760,43 +1107,44 @@ def main():
         if analysis_mode == "Single Repository":
             st.header("Repository Settings")
             
-            repo_path = st.text_input(
-                "Repository Path or URL",
-                placeholder="/path/to/repo or https://github.com/user/repo",
-                help="Enter a local path or GitHub URL"
-            )
-            
-            branch = st.text_input(
-                "Branch (optional)",
-                placeholder="main",
-                help="Leave empty for default branch"
-            )
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                since_date = st.date_input(
-                    "📅 Since Date",
-                    value=None,
-                    help="Filter commits from this date"
-                )
-            with col2:
-                until_date = st.date_input(
-                    "📅 Until Date",
-                    value=None,
-                    help="Filter commits until this date"
+            with st.form("single_repo_form"):
+                repo_path = st.text_input(
+                    "Repository Path or URL",
+                    placeholder="/path/to/repo or https://github.com/user/repo",
+                    help="Enter a local path or GitHub URL"
                 )
             
-            # Optional token for private repos
-            with st.expander("🔐 GitHub Token (for private repos)"):
-                github_token = st.text_input(
-                    "Personal Access Token",
-                    type="password",
-                    value=st.session_state.github_token,
-                    help="Required for private repositories",
-                    key="single_repo_token"
+                branch = st.text_input(
+                    "Branch (optional)",
+                    placeholder="main",
+                    help="Leave empty for default branch"
                 )
             
-            analyze_button = st.button("🔍 Analyze Repository", type="primary", use_container_width=True)
+                col1, col2 = st.columns(2)
+                with col1:
+                    since_date = st.date_input(
+                        "📅 Since Date",
+                        value=None,
+                        help="Filter commits from this date"
+                    )
+                with col2:
+                    until_date = st.date_input(
+                        "📅 Until Date",
+                        value=None,
+                        help="Filter commits until this date"
+                    )
+            
+                # Optional token for private repos
+                with st.expander("🔐 GitHub Token (for private repos)"):
+                    github_token = st.text_input(
+                        "Personal Access Token",
+                        type="password",
+                        value=st.session_state.github_token,
+                        help="Required for private repositories",
+                        key="single_repo_token"
+                    )
+            
+                analyze_button = st.form_submit_button("🔍 Analyze Repository", type="primary", use_container_width=True)
             
         else:  # GitHub Team mode
             st.header("GitHub Team Settings")
@@ -815,26 +1163,43 @@ def main():
                 key="team_token"
             )
             
-            teams = []
+            teams_by_name = {}
             selected_team = None
             
             if github_org and github_token:
                 try:
-                    with st.spinner("Loading teams..."):
-                        teams = get_github_teams(github_org, github_token)
+                    # Teams are loaded once per organization and token and kept
+                    # for the session, so later reruns don't hit the API again
+                    teams_key = _session_key(github_org, github_token)
+                    reload_teams = st.button("🔄 Reload teams", use_container_width=True)
+                    if reload_teams or st.session_state.get("teams_key") != teams_key:
+                        if reload_teams:
+                            get_org_teams_with_repos.clear()
+                            get_github_teams.clear()
+                            get_team_repos.clear()
+                        with st.spinner("Loading teams..."):
+                            # One GraphQL query lists teams and their repositories;
+                            # fall back to the REST listings if it is unavailable
+                            teams = get_org_teams_with_repos(github_org, github_token)
+                            if teams is None:
+                                teams = get_github_teams(github_org, github_token)
+                        st.session_state["teams_by_name"] = {t['name']: t for t in teams}
+                        st.session_state["teams_key"] = teams_key
+                    teams_by_name = st.session_state["teams_by_name"]
                     
-                    if teams:
-                        team_names = [t['name'] for t in teams]
+                    if teams_by_name:
                         selected_team_name = st.selectbox(
                             "Select Team",
-                            options=team_names,
+                            options=list(teams_by_name),
                             help="Select a team to analyze its repositories"
                         )
-                        selected_team = next((t for t in teams if t['name'] == selected_team_name), None)
+                        selected_team = teams_by_name.get(selected_team_name)
                         
                         if selected_team:
-                            with st.spinner("Loading team repositories..."):
-                                team_repos = get_team_repos(github_org, selected_team['slug'], github_token)
+                            team_repos = selected_team.get('repos')
+                            if team_repos is None:
+                                with st.spinner("Loading team repositories..."):
+                                    team_repos = get_team_repos(github_org, selected_team['slug'], github_token)
                             
                             st.success(f"Found {len(team_repos)} repositories in team '{selected_team_name}'")
                             
@@ -847,6 +1212,7 @@ def main():
                                     options=repo_names,
                                     default=repo_names[:5] if len(repo_names) > 5 else repo_names
                                 )
+                                selected_repos = set(selected_repos)
                                 team_repos = [r for r in team_repos if r['name'] in selected_repos]
                     else:
                         st.warning("No teams found in this organization")
@@ -856,34 +1222,41 @@ def main():
                 except Exception as e:
                     st.error(f"Error loading teams: {str(e)}")
             
-            branch = st.text_input(
-                "Branch (optional)",
-                placeholder="main",
-                help="Leave empty for default branch"
-            )
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                since_date = st.date_input(
-                    "📅 Since Date",
-                    value=None,
-                    help="Filter commits from this date",
-                    key="team_since"
+            with st.form("team_form"):
+                branch = st.text_input(
+                    "Branch (optional)",
+                    placeholder="main",
+                    help="Leave empty for default branch"
                 )
-            with col2:
-                until_date = st.date_input(
-                    "📅 Until Date",
-                    value=None,
-                    help="Filter commits until this date",
-                    key="team_until"
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    since_date = st.date_input(
+                        "📅 Since Date",
+                        value=None,
+                        help="Filter commits from this date",
+                        key="team_since"
+                    )
+                with col2:
+                    until_date = st.date_input(
+                        "📅 Until Date",
+                        value=None,
+                        help="Filter commits until this date",
+                        key="team_until"
+                    )
+                
+                analyze_button = st.form_submit_button(
+                    f"🔍 Analyze {len(team_repos)} Repositories" if team_repos else "🔍 Analyze",
+                    type="primary",
+                    use_container_width=True,
+                    disabled=not team_repos
                 )
-            
-            analyze_button = st.button(
-                f"🔍 Analyze {len(team_repos)} Repositories" if team_repos else "🔍 Analyze",
-                type="primary",
-                use_container_width=True,
-                disabled=not team_repos
-            )
+        
+        force_refresh = st.checkbox(
+            "🔄 Force refresh",
+            value=False,
+            help="Re-run the analysis instead of reusing cached results for the same inputs"
+        )
         
         st.divider()
         
@@ -900,30 +1273,47 @@ def main():
         """)
     
     # Main content - handle analysis
+    result_cache = st.session_state.setdefault("result_cache", {})
     if analysis_mode == "Single Repository":
         if analyze_button and repo_path:
             since_str = since_date.isoformat() if since_date else None
             until_str = until_date.isoformat() if until_date else None
             token = github_token if github_token else None
             
-            result = analyze_git_repo(repo_path, branch or None, since_str, until_str, token)
+            key = _session_key(repo_path, branch or None, since_str, until_str, token)
+            result = None if force_refresh else result_cache.get(key)
+            if force_refresh:
+                result = _analyze_with_progress(
+                    repo_path, branch or None, since_str, until_str, token, refresh=True
+                )
+            elif result is None:
+                result = analyze_git_repo(repo_path, branch or None, since_str, until_str, token)
             
             if result:
+                _remember_result(result_cache, key, result)
                 st.session_state["result"] = result
     else:  # GitHub Team mode
         if analyze_button and team_repos:
             since_str = since_date.isoformat() if since_date else None
             until_str = until_date.isoformat() if until_date else None
             
-            result = analyze_multiple_repos(
-                team_repos,
-                branch=branch or None,
-                since_date=since_str,
-                until_date=until_str,
-                token=github_token
+            key = _session_key(
+                tuple(sorted(r['clone_url'] for r in team_repos)),
+                branch or None, since_str, until_str, github_token
             )
+            result = None if force_refresh else result_cache.get(key)
+            if result is None:
+                result = analyze_multiple_repos(
+                    team_repos,
+                    branch=branch or None,
+                    since_date=since_str,
+                    until_date=until_str,
+                    token=github_token,
+                    refresh=force_refresh
+                )
             
             if result:
+                _remember_result(result_cache, key, result)
                 st.session_state["result"] = result
     
     # Display results
@@ -934,14 +1324,12 @@ def main():
         st.markdown("---")
         col1, col2, col3 = st.columns([1, 2, 1])
         with col2:
-            st.markdown("""
-            <div style="text-align: center; padding: 50px;">
-                <h3>🔍 No Repository Analyzed</h3>
-                <p>Enter a repository path in the sidebar to analyze AI usage patterns.</p>
-                <p>Or select a GitHub team to analyze all repositories under that team.</p>
-                <p>The tool will scan commit messages and Agents.md files to detect AI-assisted development.</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.subheader("🔍 No Repository Analyzed")
+            st.info(
+                "Enter a repository path in the sidebar to analyze AI usage patterns.\n\n"
+                "Or select a GitHub team to analyze all repositories under that team.\n\n"
+                "The tool will scan commit messages and Agents.md files to detect AI-assisted development."
+            )
 
 
 if __name__ == "__main__":
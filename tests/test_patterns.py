@@ -0,0 +1,125 @@
+# Copyright 2024 AI Usage Measurement Framework Contributors
+# Licensed under the MIT License
+
+"""Tests for AI pattern detection and confidence scoring."""
+
+import copy
+import re
+from re import _parser
+
+import pytest
+
+from ai_usage_measurement_framework import patterns
+from ai_usage_measurement_framework.patterns import (
+    AI_COMMIT_PATTERNS,
+    GENERIC_AI_PATTERNS,
+    TOOL_PATTERNS,
+    calculate_confidence_score,
+    compile_patterns,
+    detect_ai_patterns,
+    detect_ai_usage,
+)
+
+ALL_PATTERNS = sorted(
+    set(AI_COMMIT_PATTERNS)
+    | {p for config in TOOL_PATTERNS.values() for p in config["patterns"]}
+    | {p for config in GENERIC_AI_PATTERNS.values() for p in config["patterns"]}
+    | {r"vibe+coded", r"ab+c", r"x?yz+w", r"a.b+"}
+)
+
+
+def _matching_texts(pattern: str) -> list[str]:
+    """Build texts matching pattern, with repeats at their minimum and stretched."""
+
+    def build(items, extra: int) -> str:
+        out = []
+        for op, av in items:
+            if op is _parser.LITERAL:
+                out.append(chr(av))
+            elif op is _parser.ANY:
+                out.append("x")
+            elif op is _parser.IN:
+                kind, value = av[0]
+                out.append(" " if kind is _parser.CATEGORY else chr(value))
+            elif op in (_parser.MAX_REPEAT, _parser.MIN_REPEAT):
+                low, high, sub = av
+                out.append(build(sub, extra) * min(low + extra, high))
+            else:
+                raise NotImplementedError(op)
+        return "".join(out)
+
+    parsed = _parser.parse(pattern)
+    return [build(parsed, extra) for extra in (0, 2)]
+
+
+@pytest.fixture
+def restore_patterns():
+    """Undo edits a test makes to the public pattern tables."""
+    saved = (
+        list(AI_COMMIT_PATTERNS),
+        copy.deepcopy(TOOL_PATTERNS),
+        copy.deepcopy(GENERIC_AI_PATTERNS),
+    )
+    yield
+    AI_COMMIT_PATTERNS[:] = saved[0]
+    TOOL_PATTERNS.clear()
+    TOOL_PATTERNS.update(saved[1])
+    GENERIC_AI_PATTERNS.clear()
+    GENERIC_AI_PATTERNS.update(saved[2])
+    compile_patterns()
+
+
+@pytest.mark.parametrize("category", sorted(GENERIC_AI_PATTERNS))
+def test_generic_match_adds_weight_times_point_three(category):
+    config = GENERIC_AI_PATTERNS[category]
+    score, level = calculate_confidence_score(config["patterns"][:1], [])
+    assert score == pytest.approx(config["weight"] * 0.3)
+    assert level == "low"
+
+
+def test_ai_generated_commit_scores_low():
+    patterns, tools = detect_ai_usage("feat: add parser (ai-generated)")
+    score, level = calculate_confidence_score(patterns, tools)
+    assert 0.09 <= score <= 0.18
+    assert level == "low"
+
+
+def test_generic_and_tool_scores_add_up():
+    patterns, tools = detect_ai_usage("AI-generated with GitHub Copilot")
+    score, _ = calculate_confidence_score(patterns, tools)
+    expected = (
+        GENERIC_AI_PATTERNS["ai-generated"]["weight"] * 0.3
+        + TOOL_PATTERNS["GitHub Copilot"]["weight"] * 0.5
+    )
+    assert tools == ["GitHub Copilot"]
+    assert score == pytest.approx(expected)
+
+
+def test_no_patterns_scores_none():
+    assert calculate_confidence_score([], []) == (0.0, "none")
+
+
+def test_mixed_matcher_engines(restore_patterns):
+    pytest.importorskip("hyperscan")
+    # Hyperscan rejects lookbehind, so only the tool table falls back to re
+    TOOL_PATTERNS["GitHub Copilot"]["patterns"].append(r"(?<=by )bot")
+    compile_patterns()
+    assert type(patterns._AI_MATCHER) is not type(patterns._TOOL_MATCHER)
+
+    found, tools = detect_ai_usage("generated by bot with copilot")
+    assert "copilot" in found
+    assert tools == ["GitHub Copilot"]
+
+
+@pytest.mark.parametrize("pattern", ALL_PATTERNS)
+def test_prefilter_keeps_every_match(pattern):
+    triggers = patterns._build_triggers([[pattern]])
+    for text in _matching_texts(pattern):
+        assert re.search(pattern, text)
+        assert patterns._has_trigger(text, triggers)
+
+
+def test_repeated_character_pattern_detected(restore_patterns):
+    AI_COMMIT_PATTERNS.append(r"vibe+coded")
+    compile_patterns()
+    assert r"vibe+coded" in detect_ai_patterns("this was vibeecoded")